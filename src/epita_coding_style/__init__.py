@@ -1,15 +1,23 @@
 """EPITA C/C++ Coding Style Checker."""
 
-from importlib.metadata import version
+from importlib.metadata import PackageNotFoundError, version
 
-__version__ = version("epita-coding-style")
+# __version__ of a source checkout without installed metadata
+UNKNOWN_VERSION = "0+unknown"
+
+try:
+    __version__ = version("epita-coding-style")
+except PackageNotFoundError:  # running from a source checkout (pythonpath = ["src"])
+    __version__ = UNKNOWN_VERSION
 
 from .core import Violation, Severity, Lang, lang_from_path
 from .config import Config, load_config, PRESETS
-from .checker import check_file, main
+from .checker import check_file, check_files, check_source, main
 
 __all__ = [
     "check_file",
+    "check_files",
+    "check_source",
     "Violation",
     "Severity",
     "Lang",
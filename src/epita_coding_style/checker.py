@@ -5,18 +5,23 @@ from __future__ import annotations
 
 import argparse
 import json
+import multiprocessing
 import os
 import sys
 import threading
 import urllib.request
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import repeat
 from pathlib import Path
 
-from . import __version__
+from . import UNKNOWN_VERSION, __version__
 from .config import Config, PRESETS, RULES_META, load_config
-from .core import Violation, Severity, parse, parse_cpp, NodeCache, Lang, lang_from_path, ALL_EXTS, CXX_BAD_EXTS
+from .core import Violation, Severity, parse, parse_cpp, NodeCache, Lang, lang_from_path, ALL_EXTS, CXX_EXT_FIXES
 from .checks import (
     check_file_format, check_braces, check_functions, check_exports,
     check_preprocessor, check_misc, check_vla, check_ctrl_empty, check_clang_format,
+    clang_format_config,
 )
 from .checks_cxx import (
     check_cxx_preprocessor, check_cxx_globals, check_cxx_naming,
@@ -36,12 +41,58 @@ def check_file(path: str, cfg: Config) -> list[Violation]:
     except Exception as e:
         return [Violation(path, 0, "file.read", str(e))]
 
+    return _check_content(path, lang, content, cfg, on_disk=True)
+
+
+def check_source(path: str, content: str, cfg: Config) -> list[Violation]:
+    """Run all checks on in-memory source as if it were the file at path.
+
+    The source text is not read from disk: path selects C or C++, feeds the
+    name-based rules (extension, include guard, same-name header) and still
+    decides which .clang-format config is used; clang-format is given the
+    content on stdin.
+    """
+    lang = lang_from_path(path)
+    if lang is None:
+        return []
+    return _check_content(path, lang, content, cfg, on_disk=False)
+
+
+def _check_content(path: str, lang: Lang, content: str, cfg: Config,
+                   on_disk: bool) -> list[Violation]:
+    """Run the checks for lang on content; on_disk lets clang-format read path."""
     lines = content.split('\n')
     content_bytes = content.encode()
 
-    if lang == Lang.CXX:
-        return _check_cxx_file(path, cfg, content, lines, content_bytes)
-    return _check_c_file(path, cfg, content, lines, content_bytes)
+    check = _check_cxx_file if lang == Lang.CXX else _check_c_file
+    if not cfg.is_enabled("format") or not clang_format_config(path):
+        return check(path, cfg, content, lines, content_bytes)
+
+    # clang-format runs as a subprocess: overlap it with the in-process checks
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        fmt = pool.submit(check_clang_format, path, cfg, None if on_disk else content)
+        violations = check(path, cfg, content, lines, content_bytes)
+    return violations + fmt.result()
+
+
+def check_files(paths: list[str], cfg: Config, jobs: int = 1) -> Iterator[list[Violation]]:
+    """Yield the violations of each file, in order, using up to `jobs` processes.
+
+    jobs=0 uses one worker per CPU. Workers are spawned (not forked) since the
+    CLI runs a background update-check thread.
+    """
+    if jobs == 0:
+        jobs = os.cpu_count() or 1
+    jobs = min(jobs, len(paths))
+    if jobs <= 1:
+        for path in paths:
+            yield check_file(path, cfg)
+        return
+
+    chunksize = max(1, len(paths) // (jobs * 4))
+    ctx = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=jobs, mp_context=ctx) as pool:
+        yield from pool.map(check_file, paths, repeat(cfg), chunksize=chunksize)
 
 
 def _check_c_file(path: str, cfg: Config, content: str, lines: list[str],
@@ -58,8 +109,7 @@ def _check_c_file(path: str, cfg: Config, content: str, lines: list[str],
         check_preprocessor(path, lines, cfg, nodes=nodes, content_bytes=content_bytes) +
         check_misc(path, nodes, content_bytes, lines, cfg) +
         check_vla(path, nodes, content_bytes, lines, cfg) +
-        check_ctrl_empty(path, lines, cfg, nodes=nodes) +
-        check_clang_format(path, cfg)
+        check_ctrl_empty(path, lines, cfg, nodes=nodes)
     )
 
 
@@ -70,10 +120,9 @@ def _check_cxx_file(path: str, cfg: Config, content: str, lines: list[str],
 
     # file.ext: wrong C++ extension
     ext_violations = []
-    if cxx_cfg.is_enabled("file.ext") and path.endswith(CXX_BAD_EXTS):
-        ext = Path(path).suffix
-        ext_map = {'.cpp': '.cc', '.hpp': '.hh'}
-        expected = ext_map.get(ext, '.cc')
+    ext = os.path.splitext(path)[1]
+    expected = CXX_EXT_FIXES.get(ext)
+    if expected and cxx_cfg.is_enabled("file.ext"):
         ext_violations = [Violation(path, 1, "file.ext",
                                     f"Use '{expected}' extension instead of '{ext}'")]
 
@@ -88,8 +137,7 @@ def _check_cxx_file(path: str, cfg: Config, content: str, lines: list[str],
         check_cxx_naming(path, lines, content_bytes, nodes, cxx_cfg) +
         check_cxx_declarations(path, lines, content_bytes, nodes, cxx_cfg) +
         check_cxx_control(path, lines, content_bytes, nodes, cxx_cfg) +
-        check_cxx_writing(path, lines, content_bytes, nodes, cxx_cfg) +
-        check_clang_format(path, cxx_cfg)
+        check_cxx_writing(path, lines, content_bytes, nodes, cxx_cfg)
     )
 
 
@@ -196,6 +244,8 @@ def _parse_version(v: str) -> tuple[int, ...]:
 
 def _check_for_update() -> str | None:
     """Check PyPI for a newer version. Returns a message string or None."""
+    if __version__ == UNKNOWN_VERSION:  # source checkout, nothing to compare against
+        return None
     try:
         url = "https://pypi.org/pypi/epita-coding-style/json"
         req = urllib.request.Request(url, headers={"Accept": "application/json"})
@@ -286,6 +336,11 @@ Exit codes:
     lim_group.add_argument('--max-funcs', type=int, metavar='N',
                            help='max exported functions per file [default: 10]')
 
+    # Performance
+    perf_group = ap.add_argument_group('Performance')
+    perf_group.add_argument('-j', '--jobs', type=int, default=1, metavar='N',
+                            help='check files in N parallel processes, 0 = one per CPU [default: 1]')
+
     # Output
     out_group = ap.add_argument_group('Output')
     out_group.add_argument('-q', '--quiet', action='store_true',
@@ -339,6 +394,8 @@ Exit codes:
 
     if not args.paths:
         ap.error("PATH is required")
+    if args.jobs < 0:
+        ap.error("--jobs must be >= 0")
 
     R, Y, W, RST = ('\033[91m', '\033[93m', '\033[97m', '\033[0m') if use_color else ('', '', '', '')
 
@@ -351,8 +408,7 @@ Exit codes:
     total_major = total_minor = 0
     files_needing_format = []
 
-    for path in files:
-        violations = check_file(path, cfg)
+    for path, violations in zip(files, check_files(files, cfg, args.jobs)):
         if not violations:
             continue
 
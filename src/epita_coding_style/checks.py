@@ -6,6 +6,7 @@ import os
 import re
 import shutil
 import subprocess
+from functools import cache
 
 from .config import Config
 from .core import Violation, Severity, NodeCache, text, find_id, find_nodes, line_at, Lang, lang_from_path
@@ -15,6 +16,8 @@ _CHAR_LITERAL = re.compile(r"'(?:\\.|[^'\\])'")
 _INIT_ASSIGN = re.compile(r'(?<![!=<>])=(?!=)')
 _CLANG_ERROR = re.compile(r'^.*:(\d+):\d+: (?:error|warning):')
 _DIGRAPHS = ('??=', '??/', "??'", '??(', '??)', '??!', '??<', '??>', '??-', '<%', '%>', '<:', ':>')
+# Every digraph/trigraph contains one of these: a file without any has none
+_DIGRAPH_TRIGGERS = (b'??', b'<%', b'%>', b'<:', b':>')
 _ASM_KEYWORDS = ('asm(', '__asm__', '__asm')
 
 
@@ -268,6 +271,8 @@ def check_preprocessor(path: str, lines: list[str], cfg: Config,
     check_mark = cfg.is_enabled("cpp.mark")
     check_if = cfg.is_enabled("cpp.if")
     check_digraphs = cfg.is_enabled("cpp.digraphs")
+    if check_digraphs and content_bytes is not None:
+        check_digraphs = any(t in content_bytes for t in _DIGRAPH_TRIGGERS)
     if not (check_mark or check_if or check_digraphs):
         return v
 
@@ -314,7 +319,7 @@ def check_preprocessor(path: str, lines: list[str], cfg: Config,
 
 def check_vla(path: str, nodes: NodeCache, content: bytes, lines: list[str], cfg: Config) -> list[Violation]:
     """Check for variable-length arrays. Shared between C and C++."""
-    if not cfg.is_enabled("decl.vla"):
+    if not cfg.is_enabled("decl.vla") or b'[' not in content:
         return []
     v = []
     for decl in nodes.get('declaration'):
@@ -362,11 +367,10 @@ def check_ctrl_empty(path: str, lines: list[str], cfg: Config,
 def count_function_lines(body, lines: list[str]) -> int:
     """Count non-trivial lines in a function body. Shared between C and C++."""
     count = 0
-    for ln in range(body.start_point[0], body.end_point[0] + 1):
-        if ln < len(lines):
-            s = lines[ln].strip()
-            if s and s not in ('{', '}') and not s.startswith(('//', '/*', '*')):
-                count += 1
+    for line in lines[body.start_point[0]:body.end_point[0] + 1]:
+        s = line.strip()
+        if s and s not in ('{', '}') and not s.startswith(('//', '/*', '*')):
+            count += 1
     return count
 
 
@@ -403,7 +407,8 @@ def check_misc(path: str, nodes: NodeCache, content: bytes, lines: list[str], cf
                 v.append(Violation(path, line_num, "decl.single", "One declaration per line",
                                   line_content=line_content, column=col))
 
-    if cfg.is_enabled("stat.asm"):
+    # Every asm keyword contains "asm": one substring test skips the line scan
+    if cfg.is_enabled("stat.asm") and b'asm' in content:
         for i, line in enumerate(lines, 1):
             s = line.strip()
             if any(kw in s for kw in _ASM_KEYWORDS):
@@ -447,36 +452,63 @@ def _find_clang_format_config(start_path: str, lang: Lang | None = None) -> str
     return None
 
 
-def check_clang_format(path: str, cfg: Config) -> list[Violation]:
-    """Check formatting using clang-format --dry-run --Werror."""
-    if not cfg.is_enabled("format"):
-        return []
+@cache
+def _clang_format_bin() -> str | None:
+    """Absolute path of clang-format, resolved from PATH once per process."""
+    return shutil.which("clang-format")
 
-    if not shutil.which("clang-format"):
-        return []
 
-    lang = lang_from_path(path)
+@cache
+def _clang_format_config_for(directory: str, lang: Lang | None) -> str | None:
+    """Resolve the clang-format config for files in directory (absolute path).
 
-    # Find language-specific .clang-format config
-    config_file = _find_clang_format_config(path, lang)
-    if not config_file:
-        # Fallback to bundled package configs
-        pkg_dir = os.path.dirname(__file__)
-        for name in _clang_format_candidates(lang):
-            pkg_config = os.path.join(pkg_dir, name)
-            if os.path.isfile(pkg_config):
-                config_file = pkg_config
-                break
+    Uses the nearest .clang-format* found walking up, else the bundled config.
+    Cached per (directory, lang): every file of a directory shares one lookup.
+    """
+    config_file = _find_clang_format_config(directory, lang)
+    if config_file:
+        return os.path.abspath(config_file)
+    # Fallback to bundled package configs
+    pkg_dir = os.path.dirname(__file__)
+    for name in _clang_format_candidates(lang):
+        pkg_config = os.path.join(pkg_dir, name)
+        if os.path.isfile(pkg_config):
+            return os.path.abspath(pkg_config)
+    return None
+
+
+def clang_format_config(path: str) -> str | None:
+    """Config clang-format would use for path, or None if it cannot run."""
+    if not _clang_format_bin():
+        return None
+    return _clang_format_config_for(os.path.dirname(os.path.abspath(path)), lang_from_path(path))
+
+
+def check_clang_format(path: str, cfg: Config, source: str | None = None) -> list[Violation]:
+    """Check formatting using clang-format --dry-run --Werror.
+
+    clang-format reads path itself unless source is given, in which case
+    source is piped on stdin with path as the assumed file name.
+    """
+    if not cfg.is_enabled("format"):
+        return []
 
+    config_file = clang_format_config(path)
     if not config_file:
         return []
 
     try:
+        args = [_clang_format_bin(), f"--style=file:{config_file}", "--dry-run", "--Werror"]
+        if source is None:
+            args.append(path)
+        else:
+            args.append(f"--assume-filename={path}")
         result = subprocess.run(
-            ["clang-format", f"--style=file:{os.path.abspath(config_file)}",
-             "--dry-run", "--Werror", path],
+            args,
+            input=source,
             capture_output=True,
-            text=True,
+            encoding="utf-8",
+            errors="replace",
             timeout=10,
         )
         if result.returncode != 0:
@@ -28,6 +28,9 @@ _C_FUNCTIONS = {"printf", "scanf", "malloc", "calloc", "realloc", "free",
 # Memory allocation functions forbidden in C++
 _MALLOC_FUNCS = {"malloc", "calloc", "realloc", "free"}
 
+# Reported by c.std_functions (allocation functions belong to no_malloc)
+_STD_ONLY_FUNCS = frozenset(_C_FUNCTIONS - _MALLOC_FUNCS)
+
 # Forbidden operator overloads
 _FORBIDDEN_OPS = {"operator,", "operator||", "operator&&"}
 
@@ -49,7 +52,8 @@ def check_cxx_preprocessor(path: str, lines: list[str], content_bytes: bytes,
     v = []
 
     if cfg.is_enabled("cpp.pragma.once") and path.endswith(('.hh', '.hxx')):
-        has_pragma = any(line.strip() == '#pragma once' for line in lines)
+        has_pragma = b'#pragma' in content_bytes \
+            and any(line.strip() == '#pragma once' for line in lines)
         if not has_pragma:
             v.append(Violation(path, 1, "cpp.pragma.once",
                                "Use #pragma once instead of include guards",
@@ -205,7 +209,7 @@ def check_cxx_globals(path: str, lines: list[str], content_bytes: bytes,
                 v.append(Violation(path, line_num, "global.memory.no_malloc",
                                    f"Don't use {fname}(), use new/delete or smart pointers",
                                    line_content=lc, column=col))
-            elif _check_std and fname in _C_FUNCTIONS and fname not in _MALLOC_FUNCS:
+            elif _check_std and fname in _STD_ONLY_FUNCS:
                 v.append(Violation(path, line_num, "c.std_functions",
                                    f"Use std::{fname} instead of {fname}",
                                    line_content=lc, column=col))
@@ -306,13 +310,18 @@ def _check_ref_pointer_placement(path: str, lines: list[str], content_bytes: byt
                                  nodes: NodeCache, cfg: Config) -> list[Violation]:
     """Check that & and * are next to type, not variable name."""
     v = []
+    # Both patterns need the sigil: skip the line scan when the file has none
+    check_ref = cfg.is_enabled("decl.ref") and b'&' in content_bytes
+    check_point = cfg.is_enabled("decl.point") and b'*' in content_bytes
+    if not (check_ref or check_point):
+        return v
 
     for i, line in enumerate(lines, 1):
         s = line.strip()
         if s.startswith(('#', '//', '/*', '*')):
             continue
 
-        if cfg.is_enabled("decl.ref"):
+        if check_ref:
             for m in _REF_PATTERN.finditer(line):
                 # Avoid matching && (logical and) or &= etc.
                 pos = m.start(0)
@@ -326,7 +335,7 @@ def _check_ref_pointer_placement(path: str, lines: list[str], content_bytes: byt
                                        "& should be next to type, not variable",
                                        line_content=line, column=amp_pos))
 
-        if cfg.is_enabled("decl.point"):
+        if check_point:
             for m in _PTR_PATTERN.finditer(line):
                 pos = m.start(0)
                 star_pos = line.index('*', pos)
@@ -524,9 +533,9 @@ def check_cxx_writing(path: str, lines: list[str], content_bytes: bytes,
         v.extend(_check_operator_padding(path, lines, content_bytes, nodes))
 
     if cfg.is_enabled("exp.linebreak"):
-        v.extend(_check_linebreak_operators(path, lines, root=nodes.root))
+        v.extend(_check_linebreak_operators(path, lines, nodes=nodes))
 
-    if cfg.is_enabled("fun.proto.void.cxx"):
+    if cfg.is_enabled("fun.proto.void.cxx") and b'void' in content_bytes:
         v.extend(_check_no_void_params(path, lines, content_bytes, nodes))
 
     if cfg.is_enabled("fun.length"):
@@ -540,7 +549,7 @@ def check_cxx_writing(path: str, lines: list[str], content_bytes: bytes,
                                        f"Function has {count} lines (max {max_lines})",
                                        line_content=line_at(lines, func.start_point[0])))
 
-    if cfg.is_enabled("op.assign"):
+    if cfg.is_enabled("op.assign") and b'operator' in content_bytes:
         v.extend(_check_op_assign(path, lines, content_bytes, nodes))
 
     # op.overload + op.overload.binand
@@ -653,12 +662,10 @@ _REF_TYPES = frozenset(('reference_declarator', 'abstract_reference_declarator',
 _PTR_TYPES = frozenset(('pointer_declarator', 'abstract_pointer_declarator'))
 
 
-def _collect_non_binary_op_lines(root) -> set[tuple[int, str]]:
+def _collect_non_binary_op_lines(nodes: NodeCache) -> set[tuple[int, str]]:
     """Find lines where >, >>, &, or * are NOT binary operators (AST-based)."""
     excluded = set()
-    stack = [root]
-    while stack:
-        node = stack.pop()
+    for node in nodes.get(*_TEMPLATE_TYPES, *_REF_TYPES, *_PTR_TYPES, 'trailing_return_type'):
         ntype = node.type
         if ntype in _TEMPLATE_TYPES:
             end_line = node.end_point[0]
@@ -676,7 +683,6 @@ def _collect_non_binary_op_lines(root) -> set[tuple[int, str]]:
             end_line = node.end_point[0]
             excluded.update(((end_line, '&'), (end_line, '*'),
                              (end_line, '>'), (end_line, '>>')))
-        stack.extend(node.children)
     return excluded
 
 
@@ -686,10 +692,10 @@ _BIN_OPS = ('&&', '||', '<<', '>>', '==', '!=', '<=', '>=',
 
 
 def _check_linebreak_operators(path: str, lines: list[str],
-                               root=None) -> list[Violation]:
+                               nodes: NodeCache | None = None) -> list[Violation]:
     """Check that line breaks come before binary operators, not after."""
     v = []
-    excluded = _collect_non_binary_op_lines(root) if root else set()
+    excluded = _collect_non_binary_op_lines(nodes) if nodes else set()
 
     for i, line in enumerate(lines, 1):
         s = line.strip()
@@ -1,7 +1,8 @@
 """Configuration system for EPITA C/C++ Coding Style Checker."""
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields, replace
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
 # Python 3.11+ has tomllib built-in, fallback for 3.10
@@ -83,7 +84,7 @@ RULES_META: dict[str, tuple[str, str]] = {
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class Config:
     """Checker configuration."""
 
@@ -178,20 +179,29 @@ class Config:
         "fun.proto.void", "keyword.goto", "cast",
     })
 
+    # Rule values forced by with_cxx(), computed once at import
+    _CXX_OVERLAY = MappingProxyType({
+        **dict.fromkeys(_CXX_RULES, True),
+        **dict.fromkeys(_C_ONLY_RULES, False),
+    })
+
     _DEFAULT_MAX_LINES = 30
 
     def with_cxx(self) -> "Config":
         """Return a copy with CXX rules enabled and C-only rules disabled."""
-        import copy
-        cfg = copy.deepcopy(self)
-        user = cfg._user_rules
-        for rule in self._CXX_RULES - user:
-            cfg.rules[rule] = True
-        for rule in self._C_ONLY_RULES - user:
-            cfg.rules[rule] = False
-        if cfg.max_lines == self._DEFAULT_MAX_LINES:
-            cfg.max_lines = 50
-        return cfg
+        user = self._user_rules
+        overlay = self._CXX_OVERLAY
+        if user:
+            overlay = {rule: on for rule, on in overlay.items() if rule not in user}
+        max_lines = self.max_lines
+        if max_lines == self._DEFAULT_MAX_LINES:
+            max_lines = 50
+        return replace(self, max_lines=max_lines, _user_rules=set(user),
+                       rules={**self.rules, **overlay})
+
+
+# Keys a config file or CLI override may set (not methods or class constants)
+_CONFIG_FIELDS = frozenset(f.name for f in fields(Config))
 
 
 # Presets (override defaults)
@@ -259,7 +269,7 @@ def load_config(
 
     # 3. Apply CLI overrides
     for key, val in overrides.items():
-        if val is not None and hasattr(cfg, key):
+        if val is not None and key in _CONFIG_FIELDS:
             setattr(cfg, key, val)
 
     return cfg
@@ -277,5 +287,5 @@ def _apply_dict(cfg: Config, data: dict[str, Any]) -> None:
         if key == "rules" and isinstance(val, dict):
             cfg.rules.update(val)
             cfg._user_rules.update(val.keys())
-        elif hasattr(cfg, key):
+        elif key in _CONFIG_FIELDS:
             setattr(cfg, key, val)
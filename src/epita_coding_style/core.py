@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
+import heapq
+import os
 from dataclasses import dataclass
 from enum import Enum
-from pathlib import Path
 
 
 class Severity(Enum):
@@ -25,16 +26,18 @@ _EXT_LANG = {
 
 C_EXTS = ('.c', '.h')
 CXX_EXTS = ('.cc', '.hh', '.hxx')
-CXX_BAD_EXTS = ('.cpp', '.hpp')
+# Discouraged C++ extension -> the one to use instead (file.ext)
+CXX_EXT_FIXES = {'.cpp': '.cc', '.hpp': '.hh'}
+CXX_BAD_EXTS = tuple(CXX_EXT_FIXES)
 ALL_EXTS = C_EXTS + CXX_EXTS + CXX_BAD_EXTS
 
 
 def lang_from_path(path: str) -> Lang | None:
     """Detect language from file extension."""
-    return _EXT_LANG.get(Path(path).suffix)
+    return _EXT_LANG.get(os.path.splitext(path)[1])
 
 
-@dataclass
+@dataclass(slots=True)
 class Violation:
     file: str
     line: int
@@ -70,17 +73,36 @@ def parse_cpp(content: bytes):
 
 
 class NodeCache:
-    """Caches AST nodes by type to avoid repeated traversals."""
+    """Indexes AST nodes by type in a single traversal, shared by all checks."""
 
     def __init__(self, root):
         self.root = root
-        self._cache: dict[str, list] = {}
+        self._index: dict[str, list] | None = None
+        self._cache: dict[tuple[str, ...], list] = {}
+
+    def _build_index(self) -> dict[str, list]:
+        """Walk the tree once, bucketing (preorder position, node) by type."""
+        index: dict[str, list] = {}
+        stack = [self.root]
+        pos = 0
+        while stack:
+            n = stack.pop()
+            index.setdefault(n.type, []).append((pos, n))
+            pos += 1
+            stack.extend(reversed(n.children))
+        return index
 
     def get(self, *types) -> list:
-        """Get all nodes of given types (cached)."""
+        """Get all nodes of given types in document order (cached)."""
         key = types
         if key not in self._cache:
-            self._cache[key] = list(find_nodes(self.root, *types))
+            if self._index is None:
+                self._index = self._build_index()
+            buckets = [self._index[t] for t in dict.fromkeys(types) if t in self._index]
+            if len(buckets) == 1:
+                self._cache[key] = [n for _, n in buckets[0]]
+            else:
+                self._cache[key] = [n for _, n in heapq.merge(*buckets)]
         return self._cache[key]
 
 
@@ -1,42 +1,71 @@
 """Pytest fixtures for coding style checker tests."""
 
+import shutil
+
 import pytest
-from epita_coding_style import check_file, Violation, Severity, Config, load_config
+from epita_coding_style import check_source, Violation, Severity, Config, load_config
+
+
+@pytest.fixture(scope="session")
+def _tmp_root(tmp_path_factory):
+    """Session-wide directory snippets are checked as if they lived in (one per xdist worker)."""
+    return tmp_path_factory.mktemp("cs_tests")
+
+
+@pytest.fixture(scope="session")
+def snippet_path(_tmp_root):
+    """Return the path a snippet with this suffix is checked as (never written)."""
+    def _path(suffix: str) -> str:
+        return str(_tmp_root / f"test{suffix}")
+    return _path
+
+
+@pytest.fixture(scope="session")
+def preset_config():
+    """Return the config for a preset, loaded once per session and shared read-only."""
+    configs: dict[str | None, Config] = {}
 
+    def _load(preset: str | None) -> Config:
+        if preset not in configs:
+            configs[preset] = load_config(preset=preset) if preset else load_config()
+        return configs[preset]
+    return _load
 
-@pytest.fixture
-def check(tmp_path):
+
+@pytest.fixture(scope="session")
+def lint(snippet_path, preset_config):
+    """Return all violations for a snippet, checking each (code, suffix, preset) once."""
+    cache: dict[tuple[str, str, str | None], tuple[Violation, ...]] = {}
+
+    def _lint(code: str, suffix: str, preset: str | None) -> list[Violation]:
+        key = (code, suffix, preset)
+        if key not in cache:
+            cache[key] = tuple(check_source(snippet_path(suffix), code, preset_config(preset)))
+        return list(cache[key])
+    return _lint
+
+
+@pytest.fixture(scope="session")
+def check(lint):
     """Check code string for a specific rule. Returns True if violated."""
     def _check(code: str, rule: str, suffix: str = ".c", preset: str | None = "42sh") -> bool:
-        path = tmp_path / f"test{suffix}"
-        if '\r' in code:
-            path.write_bytes(code.encode())
-        else:
-            path.write_text(code)
-        cfg = load_config(preset=preset) if preset else load_config()
-        return any(v.rule == rule for v in check_file(str(path), cfg))
+        return any(v.rule == rule for v in lint(code, suffix, preset))
     return _check
 
 
-@pytest.fixture
-def check_result(tmp_path):
+@pytest.fixture(scope="session")
+def check_result(lint):
     """Check code string and return violations, optionally filtered by rule."""
     def _check(code: str, rule: str | None = None, suffix: str = ".c",
                preset: str | None = "42sh") -> list[Violation]:
-        path = tmp_path / f"test{suffix}"
-        if '\r' in code:
-            path.write_bytes(code.encode())
-        else:
-            path.write_text(code)
-        cfg = load_config(preset=preset) if preset else load_config()
-        violations = check_file(str(path), cfg)
+        violations = lint(code, suffix, preset)
         if rule is not None:
             return [v for v in violations if v.rule == rule]
         return violations
     return _check
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def check_cxx(check):
     """Convenience: check C++ code (suffix=.cc, no preset)."""
     def _check(code: str, rule: str, suffix: str = ".cc") -> bool:
@@ -44,7 +73,7 @@ def check_cxx(check):
     return _check
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def check_cxx_result(check_result):
     """Convenience: check C++ code and return violations."""
     def _check(code: str, rule: str | None = None, suffix: str = ".cc") -> list[Violation]:
@@ -52,20 +81,30 @@ def check_cxx_result(check_result):
     return _check
 
 
-@pytest.fixture
-def format_check(tmp_path):
+@pytest.fixture(scope="session")
+def requires_clang_format():
+    """Skip guard: skips the requesting test when clang-format is not on PATH."""
+    if not shutil.which("clang-format"):
+        pytest.skip("clang-format not installed")
+
+
+@pytest.fixture(scope="session")
+def format_check(snippet_path, requires_clang_format):
     """Check code for format violations. Returns (has_violation, violations)."""
+    cfg = Config()
+    cache: dict[tuple[str, str], tuple[Violation, ...]] = {}
+
     def _check(code: str, suffix: str = ".c"):
-        path = tmp_path / f"test{suffix}"
-        path.write_text(code)
-        cfg = Config()
-        violations = check_file(str(path), cfg)
-        fmt = [v for v in violations if v.rule == "format"]
+        key = (code, suffix)
+        if key not in cache:
+            violations = check_source(snippet_path(suffix), code, cfg)
+            cache[key] = tuple(v for v in violations if v.rule == "format")
+        fmt = list(cache[key])
         return len(fmt) > 0, fmt
     return _check
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def format_passes(format_check):
     """Assert code passes format check."""
     def _assert(code: str, suffix: str, msg: str = ""):
@@ -74,7 +113,7 @@ def format_passes(format_check):
     return _assert
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def format_fails(format_check):
     """Assert code fails format check."""
     def _assert(code: str, suffix: str, msg: str = ""):
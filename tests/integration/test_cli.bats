@@ -347,6 +347,13 @@ teardown() {
     [[ "$output" != *$'\033'* ]]
 }
 
+@test "-j checks files in parallel" {
+    run uv run epita-coding-style -j 2 "$TMP_DIR/bad_goto.c" "$TMP_DIR/bad_cast.c"
+    [ "$status" -eq 1 ]
+    [[ "$output" == *"keyword.goto"* ]]
+    [[ "$output" == *"Files: 2"* ]]
+}
+
 # === Format Check ===
 
 @test "format rule detects bad formatting" {
@@ -0,0 +1,36 @@
+"""Tests for the public checking API (check_file, check_files, check_source)."""
+
+from epita_coding_style import check_file, check_files, check_source, Config
+
+
+def test_check_files_parallel_matches_sequential(tmp_path):
+    """check_files() with worker processes yields the same violations, in order."""
+    paths = []
+    for i, code in enumerate(("int x = 1;   \n", "int x = 1;", "int a;\nint b;\n")):
+        path = tmp_path / f"f{i}.c"
+        path.write_text(code)
+        paths.append(str(path))
+    cfg = Config()
+    cfg.rules["format"] = False
+    assert list(check_files(paths, cfg, jobs=2)) == list(check_files(paths, cfg))
+
+
+def test_check_source_matches_check_file(tmp_path):
+    """check_source() on in-memory content reports what check_file() reads from disk."""
+    cfg = Config()
+    for name, code in (("bad.c", "int main(void){int x=1;   \nreturn x;}"),
+                       ("bad.hh", "class foo {\npublic:\n  int *x;\n};\n")):
+        path = tmp_path / name
+        path.write_text(code)
+        assert check_source(str(path), code, cfg) == check_file(str(path), cfg)
+
+
+def test_update_check_skipped_without_version(monkeypatch):
+    """A source checkout without package metadata never reports an update."""
+    from epita_coding_style import checker
+
+    calls = []
+    monkeypatch.setattr(checker, "__version__", checker.UNKNOWN_VERSION)
+    monkeypatch.setattr(checker.urllib.request, "urlopen", lambda *a, **kw: calls.append(a))
+    assert checker._check_for_update() is None
+    assert not calls
@@ -98,28 +98,40 @@ CHAR_WITH_VIOLATION = dedent("""\
 """)
 
 
-@pytest.mark.parametrize("code,should_fail", [
-    (ALLMAN, False),
-    (KR_FUNC, True),
-    (KR_IF, True),
-    (ELSE_SAME_LINE, True),
-], ids=["allman-ok", "kr-func", "kr-if", "else-same-line"])
+BRACES_CASES = (
+    pytest.param(ALLMAN, False, id="allman-ok"),
+    pytest.param(KR_FUNC, True, id="kr-func"),
+    pytest.param(KR_IF, True, id="kr-if"),
+    pytest.param(ELSE_SAME_LINE, True, id="else-same-line"),
+)
+
+
+@pytest.mark.parametrize("code,should_fail", BRACES_CASES)
 def test_braces(check, code, should_fail):
     # Use noformat preset to test braces independently from clang-format
     assert check(code, "braces", preset="noformat") == should_fail
 
 
-@pytest.mark.parametrize("code", [
-    "int arr[] = {1, 2, 3};\n",
-    DO_WHILE,
-    MACRO,
-], ids=["array-init", "do-while", "macro"])
+BRACES_EXCEPTIONS_CASES = (
+    pytest.param("int arr[] = {1, 2, 3};\n", id="array-init"),
+    pytest.param(DO_WHILE, id="do-while"),
+    pytest.param(MACRO, id="macro"),
+)
+
+
+@pytest.mark.parametrize("code", BRACES_EXCEPTIONS_CASES)
 def test_braces_exceptions(check, code):
     assert not check(code, "braces", preset="noformat")
 
 
-@pytest.mark.parametrize("code", [CHAR_OPEN, CHAR_CLOSE, CHAR_BOTH],
-                         ids=["char-open", "char-close", "char-both"])
+BRACES_CHAR_LITERALS_NO_FALSE_POSITIVE_CASES = (
+    pytest.param(CHAR_OPEN, id="char-open"),
+    pytest.param(CHAR_CLOSE, id="char-close"),
+    pytest.param(CHAR_BOTH, id="char-both"),
+)
+
+
+@pytest.mark.parametrize("code", BRACES_CHAR_LITERALS_NO_FALSE_POSITIVE_CASES)
 def test_braces_char_literals_no_false_positive(check, code):
     assert not check(code, "braces", preset="noformat")
 
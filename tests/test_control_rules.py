@@ -4,11 +4,14 @@ import pytest
 from textwrap import dedent
 
 
-@pytest.mark.parametrize("code,should_fail", [
-    ("int x = 1;\n", False),
-    ('asm("nop");\n', True),
-    ('__asm__("nop");\n', True),
-], ids=["no-asm", "asm", "__asm__"])
+STAT_ASM_CASES = (
+    pytest.param("int x = 1;\n", False, id="no-asm"),
+    pytest.param('asm("nop");\n', True, id="asm"),
+    pytest.param('__asm__("nop");\n', True, id="__asm__"),
+)
+
+
+@pytest.mark.parametrize("code,should_fail", STAT_ASM_CASES)
 def test_stat_asm(check, code, should_fail):
     assert check(code, "stat.asm") == should_fail
 
@@ -40,10 +43,13 @@ CTRL_FOR_FAIL = dedent("""\
 """)
 
 
-@pytest.mark.parametrize("code,should_fail", [
-    (CTRL_OK, False),
-    (CTRL_WHILE_FAIL, True),
-    (CTRL_FOR_FAIL, True),
-], ids=["while-body-ok", "while-empty", "for-empty"])
+CTRL_EMPTY_CASES = (
+    pytest.param(CTRL_OK, False, id="while-body-ok"),
+    pytest.param(CTRL_WHILE_FAIL, True, id="while-empty"),
+    pytest.param(CTRL_FOR_FAIL, True, id="for-empty"),
+)
+
+
+@pytest.mark.parametrize("code,should_fail", CTRL_EMPTY_CASES)
 def test_ctrl_empty(check, code, should_fail):
     assert check(code, "ctrl.empty") == should_fail
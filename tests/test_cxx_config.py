@@ -1,21 +1,24 @@
 """Tests for CXX config handling — idempotency, with_cxx(), language detection."""
 
 import pytest
-from epita_coding_style import Config, Lang, lang_from_path
+from epita_coding_style import Config, Lang, lang_from_path, load_config
 
 
 # ── lang_from_path ───────────────────────────────────────────────────────
 
 
-@pytest.mark.parametrize("path,expected", [
-    ("foo.c", Lang.C),
-    ("foo.h", Lang.C),
-    ("foo.cc", Lang.CXX),
-    ("foo.hh", Lang.CXX),
-    ("foo.hxx", Lang.CXX),
-    ("foo.py", None),
-    ("/some/dir/foo.cc", Lang.CXX),
-], ids=["c-source", "c-header", "cxx-source", "cxx-header", "cxx-hxx", "unknown-ext", "nested-path"])
+LANG_FROM_PATH_CASES = (
+    pytest.param("foo.c", Lang.C, id="c-source"),
+    pytest.param("foo.h", Lang.C, id="c-header"),
+    pytest.param("foo.cc", Lang.CXX, id="cxx-source"),
+    pytest.param("foo.hh", Lang.CXX, id="cxx-header"),
+    pytest.param("foo.hxx", Lang.CXX, id="cxx-hxx"),
+    pytest.param("foo.py", None, id="unknown-ext"),
+    pytest.param("/some/dir/foo.cc", Lang.CXX, id="nested-path"),
+)
+
+
+@pytest.mark.parametrize("path,expected", LANG_FROM_PATH_CASES)
 def test_lang_from_path(path, expected):
     assert lang_from_path(path) == expected
 
@@ -45,25 +48,64 @@ def test_with_cxx_idempotent():
     assert cxx1.max_lines == cxx2.max_lines
 
 
-@pytest.mark.parametrize("rule", [
-    "global.casts", "global.nullptr", "naming.class",
-    "cpp.pragma.once", "enum.class", "fun.proto.void.cxx",
-], ids=["casts", "nullptr", "naming-class", "pragma-once", "enum-class", "proto-void-cxx"])
+def test_with_cxx_results_are_independent():
+    """Mutating one derived config never leaks into later with_cxx() calls."""
+    cxx = Config().with_cxx()
+    cxx.rules["format"] = False
+    cxx._user_rules.add("format")
+    fresh = Config().with_cxx()
+    assert fresh is not cxx
+    assert fresh.rules["format"] and not fresh._user_rules
+    cfg = Config()
+    cfg.max_args = 6
+    assert cfg.with_cxx().max_args == 6
+
+
+def test_with_cxx_passes_other_rule_values_through():
+    """with_cxx() only overrides the CXX overlay; other rule values are kept as-is."""
+    cfg = Config()
+    value = cfg.rules["format"] = [1]
+    assert cfg.with_cxx().rules["format"] is value
+
+
+WITH_CXX_ENABLES_CXX_RULES_CASES = (
+    pytest.param("global.casts", id="casts"),
+    pytest.param("global.nullptr", id="nullptr"),
+    pytest.param("naming.class", id="naming-class"),
+    pytest.param("cpp.pragma.once", id="pragma-once"),
+    pytest.param("enum.class", id="enum-class"),
+    pytest.param("fun.proto.void.cxx", id="proto-void-cxx"),
+)
+
+
+@pytest.mark.parametrize("rule", WITH_CXX_ENABLES_CXX_RULES_CASES)
 def test_with_cxx_enables_cxx_rules(rule):
     assert Config().with_cxx().is_enabled(rule)
 
 
-@pytest.mark.parametrize("rule", [
-    "cpp.guard", "export.fun", "export.other",
-    "fun.proto.void", "keyword.goto", "cast",
-], ids=["guard", "export-fun", "export-other", "proto-void", "goto", "cast"])
+WITH_CXX_DISABLES_C_ONLY_RULES_CASES = (
+    pytest.param("cpp.guard", id="guard"),
+    pytest.param("export.fun", id="export-fun"),
+    pytest.param("export.other", id="export-other"),
+    pytest.param("fun.proto.void", id="proto-void"),
+    pytest.param("keyword.goto", id="goto"),
+    pytest.param("cast", id="cast"),
+)
+
+
+@pytest.mark.parametrize("rule", WITH_CXX_DISABLES_C_ONLY_RULES_CASES)
 def test_with_cxx_disables_c_only_rules(rule):
     assert not Config().with_cxx().is_enabled(rule)
 
 
-@pytest.mark.parametrize("rule", [
-    "file.dos", "file.trailing", "lines.empty",
-], ids=["file-dos", "file-trailing", "lines-empty"])
+WITH_CXX_PRESERVES_SHARED_RULES_CASES = (
+    pytest.param("file.dos", id="file-dos"),
+    pytest.param("file.trailing", id="file-trailing"),
+    pytest.param("lines.empty", id="lines-empty"),
+)
+
+
+@pytest.mark.parametrize("rule", WITH_CXX_PRESERVES_SHARED_RULES_CASES)
 def test_with_cxx_preserves_shared_rules(rule):
     assert Config().with_cxx().is_enabled(rule)
 
@@ -115,15 +157,40 @@ def test_with_cxx_preserves_user_max_lines():
 # ── CXX defaults disabled ───────────────────────────────────────────────
 
 
-@pytest.mark.parametrize("rule", [
-    "global.casts", "naming.class", "cpp.pragma.once", "enum.class",
-], ids=["casts", "naming-class", "pragma-once", "enum-class"])
+CXX_RULES_DISABLED_BY_DEFAULT_CASES = (
+    pytest.param("global.casts", id="casts"),
+    pytest.param("naming.class", id="naming-class"),
+    pytest.param("cpp.pragma.once", id="pragma-once"),
+    pytest.param("enum.class", id="enum-class"),
+)
+
+
+@pytest.mark.parametrize("rule", CXX_RULES_DISABLED_BY_DEFAULT_CASES)
 def test_cxx_rules_disabled_by_default(rule):
     assert not Config().is_enabled(rule)
 
 
-@pytest.mark.parametrize("rule", [
-    "fun.proto.void", "cpp.guard", "export.fun",
-], ids=["proto-void", "guard", "export-fun"])
+C_RULES_ENABLED_BY_DEFAULT_CASES = (
+    pytest.param("fun.proto.void", id="proto-void"),
+    pytest.param("cpp.guard", id="guard"),
+    pytest.param("export.fun", id="export-fun"),
+)
+
+
+@pytest.mark.parametrize("rule", C_RULES_ENABLED_BY_DEFAULT_CASES)
 def test_c_rules_enabled_by_default(rule):
     assert Config().is_enabled(rule)
+
+
+# ── Config file keys ────────────────────────────────────────────────────
+
+
+def test_config_file_ignores_non_field_keys(tmp_path):
+    """Keys naming methods or class constants are ignored, not set."""
+    path = tmp_path / "style.toml"
+    path.write_text("max_args = 6\nis_enabled = 1\nwith_cxx = 1\n"
+                    "_DEFAULT_MAX_LINES = 5\n_CXX_RULES = 1\n")
+    cfg = load_config(path, with_cxx=1)
+    assert cfg.max_args == 6
+    assert cfg.is_enabled("fun.length")
+    assert cfg.with_cxx().max_lines == 50
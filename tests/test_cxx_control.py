@@ -1,7 +1,6 @@
 """Tests for CXX control flow rules."""
 
 import pytest
-from textwrap import dedent
 
 
 # ── ctrl.switch ──────────────────────────────────────────────────────────
@@ -10,129 +9,138 @@ SWITCH_NO_DEFAULT = "void foo(int x) { switch (x) { case 1: break; } }\n"
 
 SWITCH_WITH_DEFAULT = "void foo(int x) { switch (x) { case 1: break; default: break; } }\n"
 
-SWITCH_NESTED_INNER_DEFAULT = dedent("""\
-    void foo(int x, int y)
+SWITCH_NESTED_INNER_DEFAULT = """\
+void foo(int x, int y)
+{
+    switch (x)
     {
-        switch (x)
+    case 1:
+        switch (y)
         {
-        case 1:
-            switch (y)
-            {
-            case 10:
-                break;
-            default:
-                break;
-            }
+        case 10:
+            break;
+        default:
             break;
         }
+        break;
     }
-""")
+}
+"""
+
+
+CTRL_SWITCH_CASES = (
+    pytest.param(SWITCH_WITH_DEFAULT, False, id="with-default"),
+    pytest.param(SWITCH_NO_DEFAULT, True, id="without-default"),
+    pytest.param(SWITCH_NESTED_INNER_DEFAULT, True, id="nested-inner-default-only"),
+)
 
 
-@pytest.mark.parametrize("code,should_fail", [
-    (SWITCH_WITH_DEFAULT, False),
-    (SWITCH_NO_DEFAULT, True),
-    (SWITCH_NESTED_INNER_DEFAULT, True),
-], ids=["with-default", "without-default", "nested-inner-default-only"])
+@pytest.mark.parametrize("code,should_fail", CTRL_SWITCH_CASES)
 def test_ctrl_switch(check_cxx, code, should_fail):
     assert check_cxx(code, "ctrl.switch") == should_fail
 
 
 # ── ctrl.switch.padding ─────────────────────────────────────────────────
 
-SWITCH_SPACE_BEFORE_COLON = dedent("""\
-    void foo(int x)
+SWITCH_SPACE_BEFORE_COLON = """\
+void foo(int x)
+{
+    switch (x)
     {
-        switch (x)
-        {
-        case 1 :
-            break;
-        default:
-            break;
-        }
+    case 1 :
+        break;
+    default:
+        break;
     }
-""")
+}
+"""
 
-SWITCH_TAB_BEFORE_COLON = dedent("""\
-    void foo(int x)
+SWITCH_TAB_BEFORE_COLON = """\
+void foo(int x)
+{
+    switch (x)
     {
-        switch (x)
-        {
-        case 1\t:
-            break;
-        default:
-            break;
-        }
+    case 1\t:
+        break;
+    default:
+        break;
     }
-""")
+}
+"""
 
-SWITCH_NO_SPACE_BEFORE_COLON = dedent("""\
-    void foo(int x)
+SWITCH_NO_SPACE_BEFORE_COLON = """\
+void foo(int x)
+{
+    switch (x)
     {
-        switch (x)
-        {
-        case 1:
-            break;
-        default:
-            break;
-        }
+    case 1:
+        break;
+    default:
+        break;
     }
-""")
+}
+"""
 
 
-@pytest.mark.parametrize("code,should_fail", [
-    (SWITCH_NO_SPACE_BEFORE_COLON, False),
-    (SWITCH_SPACE_BEFORE_COLON, True),
-    (SWITCH_TAB_BEFORE_COLON, True),
-], ids=["no-space", "space-before-colon", "tab-before-colon"])
+CTRL_SWITCH_PADDING_CASES = (
+    pytest.param(SWITCH_NO_SPACE_BEFORE_COLON, False, id="no-space"),
+    pytest.param(SWITCH_SPACE_BEFORE_COLON, True, id="space-before-colon"),
+    pytest.param(SWITCH_TAB_BEFORE_COLON, True, id="tab-before-colon"),
+)
+
+
+@pytest.mark.parametrize("code,should_fail", CTRL_SWITCH_PADDING_CASES)
 def test_ctrl_switch_padding(check_cxx, code, should_fail):
     assert check_cxx(code, "ctrl.switch.padding") == should_fail
 
 
 # ── ctrl.empty ───────────────────────────────────────────────────────────
 
-EMPTY_WHILE_BODY = dedent("""\
-    void foo()
+EMPTY_WHILE_BODY = """\
+void foo()
+{
+    while (true)
+        ;
+}
+"""
+
+WHILE_WITH_CONTINUE = """\
+void foo()
+{
+    while (true)
     {
-        while (true)
-            ;
+        continue;
     }
-""")
-
-WHILE_WITH_CONTINUE = dedent("""\
-    void foo()
+}
+"""
+
+EMPTY_FOR_BODY = """\
+void foo()
+{
+    for (;;)
+        ;
+}
+"""
+
+FOR_WITH_CONTINUE = """\
+void foo()
+{
+    for (;;)
     {
-        while (true)
-        {
-            continue;
-        }
+        continue;
     }
-""")
+}
+"""
 
-EMPTY_FOR_BODY = dedent("""\
-    void foo()
-    {
-        for (;;)
-            ;
-    }
-""")
 
-FOR_WITH_CONTINUE = dedent("""\
-    void foo()
-    {
-        for (;;)
-        {
-            continue;
-        }
-    }
-""")
+CTRL_EMPTY_CASES = (
+    pytest.param(WHILE_WITH_CONTINUE, False, id="continue-ok"),
+    pytest.param(EMPTY_WHILE_BODY, True, id="empty-while"),
+    pytest.param(FOR_WITH_CONTINUE, False, id="for-continue-ok"),
+    pytest.param(EMPTY_FOR_BODY, True, id="empty-for"),
+)
 
 
-@pytest.mark.parametrize("code,should_fail", [
-    (WHILE_WITH_CONTINUE, False),
-    (EMPTY_WHILE_BODY, True),
-    (FOR_WITH_CONTINUE, False),
-    (EMPTY_FOR_BODY, True),
-], ids=["continue-ok", "empty-while", "for-continue-ok", "empty-for"])
+@pytest.mark.parametrize("code,should_fail", CTRL_EMPTY_CASES)
 def test_ctrl_empty(check_cxx, code, should_fail):
     assert check_cxx(code, "ctrl.empty") == should_fail
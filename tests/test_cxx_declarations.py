@@ -1,7 +1,6 @@
 """Tests for CXX declaration rules."""
 
 import pytest
-from textwrap import dedent
 
 
 # ── decl.ref ─────────────────────────────────────────────────────────────
@@ -10,10 +9,13 @@ REF_NEXT_TO_VAR = "void foo(int &x) {}\n"
 REF_NEXT_TO_TYPE = "void foo(int& x) {}\n"
 
 
-@pytest.mark.parametrize("code,should_fail", [
-    (REF_NEXT_TO_TYPE, False),
-    (REF_NEXT_TO_VAR, True),
-], ids=["ref-left-ok", "ref-right-bad"])
+DECL_REF_CASES = (
+    pytest.param(REF_NEXT_TO_TYPE, False, id="ref-left-ok"),
+    pytest.param(REF_NEXT_TO_VAR, True, id="ref-right-bad"),
+)
+
+
+@pytest.mark.parametrize("code,should_fail", DECL_REF_CASES)
 def test_decl_ref(check_cxx, code, should_fail):
     assert check_cxx(code, "decl.ref") == should_fail
 
@@ -24,86 +26,91 @@ PTR_NEXT_TO_VAR = "void foo(int *x) {}\n"
 PTR_NEXT_TO_TYPE = "void foo(int* x) {}\n"
 
 
-@pytest.mark.parametrize("code,should_fail", [
-    (PTR_NEXT_TO_TYPE, False),
-    (PTR_NEXT_TO_VAR, True),
-], ids=["ptr-left-ok", "ptr-right-bad"])
+DECL_POINT_CASES = (
+    pytest.param(PTR_NEXT_TO_TYPE, False, id="ptr-left-ok"),
+    pytest.param(PTR_NEXT_TO_VAR, True, id="ptr-right-bad"),
+)
+
+
+@pytest.mark.parametrize("code,should_fail", DECL_POINT_CASES)
 def test_decl_point(check_cxx, code, should_fail):
     assert check_cxx(code, "decl.point") == should_fail
 
 
 # ── decl.ctor.explicit ──────────────────────────────────────────────────
 
-CTOR_SINGLE_NOT_EXPLICIT = dedent("""\
-    class Foo
-    {
-        Foo(int x);
-    };
-""")
-
-CTOR_SINGLE_EXPLICIT = dedent("""\
-    class Foo
-    {
-        explicit Foo(int x);
-    };
-""")
-
-CTOR_MULTI_ARG = dedent("""\
-    class Foo
-    {
-        Foo(int x, int y);
-    };
-""")
-
-CTOR_ZERO_ARG = dedent("""\
-    class Foo
-    {
-        Foo();
-    };
-""")
-
-CTOR_COPY = dedent("""\
-    class Foo
-    {
-        Foo(const Foo& other);
-    };
-""")
-
-CTOR_MOVE = dedent("""\
-    class Foo
-    {
-        Foo(Foo&& other);
-    };
-""")
-
-CTOR_COPY_TEMPLATE = dedent("""\
-    template<typename T>
-    class Bar
-    {
-        Bar(const Bar<T>& other);
-    };
-""")
-
-CTOR_MOVE_TEMPLATE = dedent("""\
-    template<typename T>
-    class Bar
-    {
-        Bar(Bar<T>&& other);
-    };
-""")
-
-
-@pytest.mark.parametrize("code,should_fail", [
-    (CTOR_SINGLE_EXPLICIT, False),
-    (CTOR_MULTI_ARG, False),
-    (CTOR_ZERO_ARG, False),
-    (CTOR_COPY, False),
-    (CTOR_MOVE, False),
-    (CTOR_COPY_TEMPLATE, False),
-    (CTOR_MOVE_TEMPLATE, False),
-    (CTOR_SINGLE_NOT_EXPLICIT, True),
-], ids=["explicit-ok", "multi-arg-ok", "zero-arg-ok", "copy-ctor-ok", "move-ctor-ok",
-        "copy-ctor-template-ok", "move-ctor-template-ok", "single-not-explicit"])
+CTOR_SINGLE_NOT_EXPLICIT = """\
+class Foo
+{
+    Foo(int x);
+};
+"""
+
+CTOR_SINGLE_EXPLICIT = """\
+class Foo
+{
+    explicit Foo(int x);
+};
+"""
+
+CTOR_MULTI_ARG = """\
+class Foo
+{
+    Foo(int x, int y);
+};
+"""
+
+CTOR_ZERO_ARG = """\
+class Foo
+{
+    Foo();
+};
+"""
+
+CTOR_COPY = """\
+class Foo
+{
+    Foo(const Foo& other);
+};
+"""
+
+CTOR_MOVE = """\
+class Foo
+{
+    Foo(Foo&& other);
+};
+"""
+
+CTOR_COPY_TEMPLATE = """\
+template<typename T>
+class Bar
+{
+    Bar(const Bar<T>& other);
+};
+"""
+
+CTOR_MOVE_TEMPLATE = """\
+template<typename T>
+class Bar
+{
+    Bar(Bar<T>&& other);
+};
+"""
+
+
+DECL_CTOR_EXPLICIT_CASES = (
+    pytest.param(CTOR_SINGLE_EXPLICIT, False, id="explicit-ok"),
+    pytest.param(CTOR_MULTI_ARG, False, id="multi-arg-ok"),
+    pytest.param(CTOR_ZERO_ARG, False, id="zero-arg-ok"),
+    pytest.param(CTOR_COPY, False, id="copy-ctor-ok"),
+    pytest.param(CTOR_MOVE, False, id="move-ctor-ok"),
+    pytest.param(CTOR_COPY_TEMPLATE, False, id="copy-ctor-template-ok"),
+    pytest.param(CTOR_MOVE_TEMPLATE, False, id="move-ctor-template-ok"),
+    pytest.param(CTOR_SINGLE_NOT_EXPLICIT, True, id="single-not-explicit"),
+)
+
+
+@pytest.mark.parametrize("code,should_fail", DECL_CTOR_EXPLICIT_CASES)
 def test_decl_ctor_explicit(check_cxx, code, should_fail):
     assert check_cxx(code, "decl.ctor.explicit") == should_fail
 
@@ -114,9 +121,12 @@ VLA_DETECTED = "void foo(int n) { int arr[n]; }\n"
 FIXED_ARRAY = "void foo() { int arr[10]; }\n"
 
 
-@pytest.mark.parametrize("code,should_fail", [
-    (FIXED_ARRAY, False),
-    (VLA_DETECTED, True),
-], ids=["fixed-array-ok", "vla-detected"])
+DECL_VLA_CASES = (
+    pytest.param(FIXED_ARRAY, False, id="fixed-array-ok"),
+    pytest.param(VLA_DETECTED, True, id="vla-detected"),
+)
+
+
+@pytest.mark.parametrize("code,should_fail", DECL_VLA_CASES)
 def test_decl_vla(check_cxx, code, should_fail):
     assert check_cxx(code, "decl.vla") == should_fail
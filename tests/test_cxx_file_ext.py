@@ -13,21 +13,27 @@ SOURCE_WITH_NULLPTR = "void foo() { int* p = NULL; }\n"
 
 # ── file.ext: positive (should pass) ────────────────────────────────────
 
-@pytest.mark.parametrize("code,suffix", [
-    (SOURCE_CODE, ".cc"),
-    (HEADER_CODE, ".hh"),
-    (HEADER_CODE, ".hxx"),
-], ids=["cc-ok", "hh-ok", "hxx-ok"])
+FILE_EXT_PASS_CASES = (
+    pytest.param(SOURCE_CODE, ".cc", id="cc-ok"),
+    pytest.param(HEADER_CODE, ".hh", id="hh-ok"),
+    pytest.param(HEADER_CODE, ".hxx", id="hxx-ok"),
+)
+
+
+@pytest.mark.parametrize("code,suffix", FILE_EXT_PASS_CASES)
 def test_file_ext_pass(check_cxx, code, suffix):
     assert not check_cxx(code, "file.ext", suffix=suffix)
 
 
 # ── file.ext: negative (should fail) ────────────────────────────────────
 
-@pytest.mark.parametrize("code,suffix", [
-    (SOURCE_CODE, ".cpp"),
-    (HEADER_CODE, ".hpp"),
-], ids=["cpp-bad", "hpp-bad"])
+FILE_EXT_FAIL_CASES = (
+    pytest.param(SOURCE_CODE, ".cpp", id="cpp-bad"),
+    pytest.param(HEADER_CODE, ".hpp", id="hpp-bad"),
+)
+
+
+@pytest.mark.parametrize("code,suffix", FILE_EXT_FAIL_CASES)
 def test_file_ext_fail(check_cxx, code, suffix):
     assert check_cxx(code, "file.ext", suffix=suffix)
 
@@ -48,10 +54,13 @@ def test_cpp_ext_is_major(check_cxx_result):
     assert violations[0].severity == Severity.MAJOR
 
 
-@pytest.mark.parametrize("suffix,expected", [
-    (".cpp", "'.cc'"),
-    (".hpp", "'.hh'"),
-], ids=["cpp-suggests-cc", "hpp-suggests-hh"])
+FILE_EXT_SUGGESTION_CASES = (
+    pytest.param(".cpp", "'.cc'", id="cpp-suggests-cc"),
+    pytest.param(".hpp", "'.hh'", id="hpp-suggests-hh"),
+)
+
+
+@pytest.mark.parametrize("suffix,expected", FILE_EXT_SUGGESTION_CASES)
 def test_file_ext_suggestion(check_cxx_result, suffix, expected):
     code = SOURCE_CODE if suffix == ".cpp" else HEADER_CODE
     violations = check_cxx_result(code, rule="file.ext", suffix=suffix)
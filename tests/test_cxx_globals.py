@@ -10,11 +10,14 @@ STATIC_CAST = "void foo() { auto x = static_cast<int>(3.14); }\n"
 REINTERPRET_CAST = "void foo() { auto x = reinterpret_cast<char*>(ptr); }\n"
 
 
-@pytest.mark.parametrize("code,should_fail", [
-    (STATIC_CAST, False),
-    (REINTERPRET_CAST, False),
-    (C_STYLE_CAST, True),
-], ids=["static-cast-ok", "reinterpret-cast-ok", "c-style-cast-bad"])
+GLOBAL_CASTS_CASES = (
+    pytest.param(STATIC_CAST, False, id="static-cast-ok"),
+    pytest.param(REINTERPRET_CAST, False, id="reinterpret-cast-ok"),
+    pytest.param(C_STYLE_CAST, True, id="c-style-cast-bad"),
+)
+
+
+@pytest.mark.parametrize("code,should_fail", GLOBAL_CASTS_CASES)
 def test_global_casts(check_cxx, code, should_fail):
     assert check_cxx(code, "global.casts") == should_fail
 
@@ -27,12 +30,15 @@ FREE_CALL = "void foo() { free(ptr); }\n"
 NEW_CALL = "void foo() { int* p = new int(42); }\n"
 
 
-@pytest.mark.parametrize("code,should_fail", [
-    (NEW_CALL, False),
-    (MALLOC_CALL, True),
-    (CALLOC_CALL, True),
-    (FREE_CALL, True),
-], ids=["new-ok", "malloc-bad", "calloc-bad", "free-bad"])
+GLOBAL_MEMORY_CASES = (
+    pytest.param(NEW_CALL, False, id="new-ok"),
+    pytest.param(MALLOC_CALL, True, id="malloc-bad"),
+    pytest.param(CALLOC_CALL, True, id="calloc-bad"),
+    pytest.param(FREE_CALL, True, id="free-bad"),
+)
+
+
+@pytest.mark.parametrize("code,should_fail", GLOBAL_MEMORY_CASES)
 def test_global_memory(check_cxx, code, should_fail):
     assert check_cxx(code, "global.memory.no_malloc") == should_fail
 
@@ -43,10 +49,13 @@ NULL_USED = "void foo() { int* p = NULL; }\n"
 NULLPTR_USED = "void foo() { int* p = nullptr; }\n"
 
 
-@pytest.mark.parametrize("code,should_fail", [
-    (NULLPTR_USED, False),
-    (NULL_USED, True),
-], ids=["nullptr-ok", "null-bad"])
+GLOBAL_NULLPTR_CASES = (
+    pytest.param(NULLPTR_USED, False, id="nullptr-ok"),
+    pytest.param(NULL_USED, True, id="null-bad"),
+)
+
+
+@pytest.mark.parametrize("code,should_fail", GLOBAL_NULLPTR_CASES)
 def test_global_nullptr(check_cxx, code, should_fail):
     assert check_cxx(code, "global.nullptr") == should_fail
 
@@ -58,11 +67,14 @@ EXTERN_C_BLOCK = 'extern "C" {\nvoid cfunc();\n}\n'
 NO_EXTERN_C = "void foo() {}\n"
 
 
-@pytest.mark.parametrize("code,should_fail", [
-    (NO_EXTERN_C, False),
-    (EXTERN_C_SINGLE, True),
-    (EXTERN_C_BLOCK, True),
-], ids=["no-extern-ok", "extern-c-single", "extern-c-block"])
+C_EXTERN_CASES = (
+    pytest.param(NO_EXTERN_C, False, id="no-extern-ok"),
+    pytest.param(EXTERN_C_SINGLE, True, id="extern-c-single"),
+    pytest.param(EXTERN_C_BLOCK, True, id="extern-c-block"),
+)
+
+
+@pytest.mark.parametrize("code,should_fail", C_EXTERN_CASES)
 def test_c_extern(check_cxx, code, should_fail):
     assert check_cxx(code, "c.extern") == should_fail
 
@@ -75,12 +87,15 @@ INCLUDE_CSTDIO = "#include <cstdio>\nint main() { return 0; }\n"
 INCLUDE_IOSTREAM = "#include <iostream>\nint main() { return 0; }\n"
 
 
-@pytest.mark.parametrize("code,should_fail", [
-    (INCLUDE_CSTDIO, False),
-    (INCLUDE_IOSTREAM, False),
-    (INCLUDE_STDIO_H, True),
-    (INCLUDE_STDLIB_H, True),
-], ids=["cstdio-ok", "iostream-ok", "stdio.h-bad", "stdlib.h-bad"])
+C_HEADERS_CASES = (
+    pytest.param(INCLUDE_CSTDIO, False, id="cstdio-ok"),
+    pytest.param(INCLUDE_IOSTREAM, False, id="iostream-ok"),
+    pytest.param(INCLUDE_STDIO_H, True, id="stdio.h-bad"),
+    pytest.param(INCLUDE_STDLIB_H, True, id="stdlib.h-bad"),
+)
+
+
+@pytest.mark.parametrize("code,should_fail", C_HEADERS_CASES)
 def test_c_headers(check_cxx, code, should_fail):
     assert check_cxx(code, "c.headers") == should_fail
 
@@ -92,10 +107,13 @@ BARE_STRLEN = '#include <cstring>\nvoid foo() { strlen("hello"); }\n'
 STD_COUT = '#include <iostream>\nvoid foo() { std::cout << "hello"; }\n'
 
 
-@pytest.mark.parametrize("code,should_fail", [
-    (STD_COUT, False),
-    (BARE_PRINTF, True),
-    (BARE_STRLEN, True),
-], ids=["std-cout-ok", "printf-bad", "strlen-bad"])
+C_STD_FUNCTIONS_CASES = (
+    pytest.param(STD_COUT, False, id="std-cout-ok"),
+    pytest.param(BARE_PRINTF, True, id="printf-bad"),
+    pytest.param(BARE_STRLEN, True, id="strlen-bad"),
+)
+
+
+@pytest.mark.parametrize("code,should_fail", C_STD_FUNCTIONS_CASES)
 def test_c_std_functions(check_cxx, code, should_fail):
     assert check_cxx(code, "c.std_functions") == should_fail
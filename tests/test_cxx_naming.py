@@ -1,7 +1,6 @@
 """Tests for CXX naming rules."""
 
 import pytest
-from textwrap import dedent
 
 
 # ── naming.class ─────────────────────────────────────────────────────────
@@ -14,49 +13,52 @@ STRUCT_SNAKE_CASE = "struct my_struct {};\n"
 STRUCT_CAMELCASE = "struct MyStruct {};\n"
 
 
-@pytest.mark.parametrize("code,should_fail", [
-    (CLASS_CAMELCASE, False),
-    (CLASS_SINGLE_WORD, False),
-    (STRUCT_CAMELCASE, False),
-    (CLASS_LOWERCASE, True),
-    (CLASS_SNAKE_CASE, True),
-    (STRUCT_SNAKE_CASE, True),
-], ids=[
-    "class-camelcase-ok", "class-single-word-ok", "struct-camelcase-ok",
-    "class-lowercase-bad", "class-snake-bad", "struct-snake-bad",
-])
+NAMING_CLASS_CASES = (
+    pytest.param(CLASS_CAMELCASE, False, id="class-camelcase-ok"),
+    pytest.param(CLASS_SINGLE_WORD, False, id="class-single-word-ok"),
+    pytest.param(STRUCT_CAMELCASE, False, id="struct-camelcase-ok"),
+    pytest.param(CLASS_LOWERCASE, True, id="class-lowercase-bad"),
+    pytest.param(CLASS_SNAKE_CASE, True, id="class-snake-bad"),
+    pytest.param(STRUCT_SNAKE_CASE, True, id="struct-snake-bad"),
+)
+
+
+@pytest.mark.parametrize("code,should_fail", NAMING_CLASS_CASES)
 def test_naming_class(check_cxx, code, should_fail):
     assert check_cxx(code, "naming.class") == should_fail
 
 
 # ── naming.namespace ─────────────────────────────────────────────────────
 
-NS_UPPERCASE = dedent("""\
-    namespace MyNamespace
-    {
-        void foo() {}
-    } // namespace MyNamespace
-""")
-
-NS_LOWERCASE_OK = dedent("""\
-    namespace my_ns
-    {
-        void foo() {}
-    } // namespace my_ns
-""")
-
-NS_MISSING_COMMENT = dedent("""\
-    namespace my_ns
-    {
-        void foo() {}
-    }
-""")
-
-
-@pytest.mark.parametrize("code,should_fail", [
-    (NS_LOWERCASE_OK, False),
-    (NS_UPPERCASE, True),
-    (NS_MISSING_COMMENT, True),
-], ids=["lowercase-ok", "uppercase-bad", "missing-comment-bad"])
+NS_UPPERCASE = """\
+namespace MyNamespace
+{
+    void foo() {}
+} // namespace MyNamespace
+"""
+
+NS_LOWERCASE_OK = """\
+namespace my_ns
+{
+    void foo() {}
+} // namespace my_ns
+"""
+
+NS_MISSING_COMMENT = """\
+namespace my_ns
+{
+    void foo() {}
+}
+"""
+
+
+NAMING_NAMESPACE_CASES = (
+    pytest.param(NS_LOWERCASE_OK, False, id="lowercase-ok"),
+    pytest.param(NS_UPPERCASE, True, id="uppercase-bad"),
+    pytest.param(NS_MISSING_COMMENT, True, id="missing-comment-bad"),
+)
+
+
+@pytest.mark.parametrize("code,should_fail", NAMING_NAMESPACE_CASES)
 def test_naming_namespace(check_cxx, code, should_fail):
     assert check_cxx(code, "naming.namespace") == should_fail
@@ -1,7 +1,6 @@
 """Tests for CXX preprocessor rules."""
 
 import pytest
-from textwrap import dedent
 
 
 # ── cpp.pragma.once ──────────────────────────────────────────────────────
@@ -11,11 +10,14 @@ HEADER_WITH_PRAGMA = "#pragma once\nint x;\n"
 SOURCE_NO_PRAGMA = "int x;\n"
 
 
-@pytest.mark.parametrize("code,suffix,should_fail", [
-    (HEADER_WITH_PRAGMA, ".hh", False),
-    (SOURCE_NO_PRAGMA, ".cc", False),
-    (HEADER_WITH_GUARD, ".hh", True),
-], ids=["pragma-once-ok", "source-file-ok", "guard-instead-of-pragma"])
+CPP_PRAGMA_ONCE_CASES = (
+    pytest.param(HEADER_WITH_PRAGMA, ".hh", False, id="pragma-once-ok"),
+    pytest.param(SOURCE_NO_PRAGMA, ".cc", False, id="source-file-ok"),
+    pytest.param(HEADER_WITH_GUARD, ".hh", True, id="guard-instead-of-pragma"),
+)
+
+
+@pytest.mark.parametrize("code,suffix,should_fail", CPP_PRAGMA_ONCE_CASES)
 def test_cpp_pragma_once(check_cxx, code, suffix, should_fail):
     assert check_cxx(code, "cpp.pragma.once", suffix=suffix) == should_fail
 
@@ -30,15 +32,17 @@ INCLUDE_HEADER_H = '#include "foo.h"\nint x;\n'
 INCLUDE_SYSTEM = "#include <iostream>\nint x;\n"
 
 
-@pytest.mark.parametrize("code,should_fail", [
-    (INCLUDE_HEADER_HH, False),
-    (INCLUDE_HEADER_HXX, False),
-    (INCLUDE_SYSTEM, False),
-    (INCLUDE_SOURCE_CC, True),
-    (INCLUDE_SOURCE_C, True),
-    (INCLUDE_HEADER_H, True),
-], ids=["header-hh-ok", "header-hxx-ok", "system-ok",
-        "source-cc-bad", "source-c-bad", "header-h-bad"])
+CPP_INCLUDE_FILETYPE_CASES = (
+    pytest.param(INCLUDE_HEADER_HH, False, id="header-hh-ok"),
+    pytest.param(INCLUDE_HEADER_HXX, False, id="header-hxx-ok"),
+    pytest.param(INCLUDE_SYSTEM, False, id="system-ok"),
+    pytest.param(INCLUDE_SOURCE_CC, True, id="source-cc-bad"),
+    pytest.param(INCLUDE_SOURCE_C, True, id="source-c-bad"),
+    pytest.param(INCLUDE_HEADER_H, True, id="header-h-bad"),
+)
+
+
+@pytest.mark.parametrize("code,should_fail", CPP_INCLUDE_FILETYPE_CASES)
 def test_cpp_include_filetype(check_cxx, code, should_fail):
     assert check_cxx(code, "cpp.include.filetype") == should_fail
 
@@ -51,11 +55,14 @@ INCLUDE_SYSTEM_BEFORE_SELF = '#include <iostream>\n\n#include "test.hh"\n\nint x
 INCLUDE_LOCAL_BEFORE_SYSTEM = '#include "other.hh"\n\n#include <iostream>\n\nint x;\n'
 
 
-@pytest.mark.parametrize("code,should_fail", [
-    (INCLUDE_ORDER_CORRECT, False),
-    (INCLUDE_SYSTEM_BEFORE_SELF, True),
-    (INCLUDE_LOCAL_BEFORE_SYSTEM, True),
-], ids=["correct-order", "system-before-self", "local-before-system"])
+CPP_INCLUDE_ORDER_CASES = (
+    pytest.param(INCLUDE_ORDER_CORRECT, False, id="correct-order"),
+    pytest.param(INCLUDE_SYSTEM_BEFORE_SELF, True, id="system-before-self"),
+    pytest.param(INCLUDE_LOCAL_BEFORE_SYSTEM, True, id="local-before-system"),
+)
+
+
+@pytest.mark.parametrize("code,should_fail", CPP_INCLUDE_ORDER_CASES)
 def test_cpp_include_order(check_cxx, code, should_fail):
     assert check_cxx(code, "cpp.include.order") == should_fail
 
@@ -74,25 +81,28 @@ INCLUDES_ALPHA_OK = '#include <algorithm>\n#include <vector>\n\n#include "bar.hh
 INCLUDES_ALPHA_BAD = '#include <vector>\n#include <algorithm>\nint x;\n'
 
 
-@pytest.mark.parametrize("code,should_fail", [
-    (INCLUDES_ALPHA_OK, False),
-    (INCLUDES_ALPHA_BAD, True),
-], ids=["alphabetical-ok", "alphabetical-bad"])
+CPP_INCLUDE_ORDER_ALPHABETICAL_CASES = (
+    pytest.param(INCLUDES_ALPHA_OK, False, id="alphabetical-ok"),
+    pytest.param(INCLUDES_ALPHA_BAD, True, id="alphabetical-bad"),
+)
+
+
+@pytest.mark.parametrize("code,should_fail", CPP_INCLUDE_ORDER_ALPHABETICAL_CASES)
 def test_cpp_include_order_alphabetical(check_cxx, code, should_fail):
     assert check_cxx(code, "cpp.include.order") == should_fail
 
 
 # ── cpp.include.order (blank line between groups) ───────────────────────
 
-INCLUDES_BLANK_LINE_OK = dedent("""\
-    #include "test.hh"
+INCLUDES_BLANK_LINE_OK = """\
+#include "test.hh"
 
-    #include <iostream>
+#include <iostream>
 
-    #include "other.hh"
+#include "other.hh"
 
-    int x;
-""")
+int x;
+"""
 
 INCLUDES_NO_BLANK_LINE = '#include "test.hh"\n#include <iostream>\n#include "other.hh"\nint x;\n'
 
@@ -113,9 +123,12 @@ CONST_LITERAL = "const int x = 42;\nint main() { return 0; }\n"
 CONSTEXPR_LITERAL = "constexpr int x = 42;\nint main() { return 0; }\n"
 
 
-@pytest.mark.parametrize("code,should_fail", [
-    (CONSTEXPR_LITERAL, False),
-    (CONST_LITERAL, True),
-], ids=["constexpr-ok", "const-should-be-constexpr"])
+CPP_CONSTEXPR_CASES = (
+    pytest.param(CONSTEXPR_LITERAL, False, id="constexpr-ok"),
+    pytest.param(CONST_LITERAL, True, id="const-should-be-constexpr"),
+)
+
+
+@pytest.mark.parametrize("code,should_fail", CPP_CONSTEXPR_CASES)
 def test_cpp_constexpr(check_cxx, code, should_fail):
     assert check_cxx(code, "cpp.constexpr") == should_fail
@@ -1,7 +1,6 @@
 """Tests for CXX writing rules."""
 
 import pytest
-from textwrap import dedent
 
 
 # ── braces.empty ─────────────────────────────────────────────────────────
@@ -11,92 +10,96 @@ EMPTY_BODY_SAME_LINE = "void foo() {}\n"
 EMPTY_BODY_SPACE = "void foo() { }\n"
 
 
-@pytest.mark.parametrize("code,should_fail", [
-    (EMPTY_BODY_SAME_LINE, False),
-    (EMPTY_BODY_MULTILINE, True),
-    (EMPTY_BODY_SPACE, True),
-], ids=["same-line-ok", "multiline-bad", "space-inside-bad"])
+BRACES_EMPTY_CASES = (
+    pytest.param(EMPTY_BODY_SAME_LINE, False, id="same-line-ok"),
+    pytest.param(EMPTY_BODY_MULTILINE, True, id="multiline-bad"),
+    pytest.param(EMPTY_BODY_SPACE, True, id="space-inside-bad"),
+)
+
+
+@pytest.mark.parametrize("code,should_fail", BRACES_EMPTY_CASES)
 def test_braces_empty(check_cxx, code, should_fail):
     assert check_cxx(code, "braces.empty") == should_fail
 
 
 # ── braces.single_exp ───────────────────────────────────────────────────
 
-IF_WITHOUT_BRACES = dedent("""\
-    void foo()
+IF_WITHOUT_BRACES = """\
+void foo()
+{
+    if (true)
+        return;
+}
+"""
+
+IF_WITH_BRACES = """\
+void foo()
+{
+    if (true)
     {
-        if (true)
-            return;
+        return;
     }
-""")
+}
+"""
 
-IF_WITH_BRACES = dedent("""\
-    void foo()
+ELSE_WITHOUT_BRACES = """\
+void foo()
+{
+    if (true)
     {
-        if (true)
-        {
-            return;
-        }
+        return;
     }
-""")
-
-ELSE_WITHOUT_BRACES = dedent("""\
-    void foo()
+    else
+        return;
+}
+"""
+
+ELSE_WITH_BRACES = """\
+void foo()
+{
+    if (true)
     {
-        if (true)
-        {
-            return;
-        }
-        else
-            return;
+        return;
     }
-""")
-
-ELSE_WITH_BRACES = dedent("""\
-    void foo()
+    else
     {
-        if (true)
-        {
-            return;
-        }
-        else
-        {
-            return;
-        }
+        return;
     }
-""")
-
-DO_WITHOUT_BRACES = dedent("""\
-    void foo()
+}
+"""
+
+DO_WITHOUT_BRACES = """\
+void foo()
+{
+    do
+        continue;
+    while (true);
+}
+"""
+
+DO_WITH_BRACES = """\
+void foo()
+{
+    do
     {
-        do
-            continue;
-        while (true);
+        continue;
     }
-""")
+    while (true);
+}
+"""
 
-DO_WITH_BRACES = dedent("""\
-    void foo()
-    {
-        do
-        {
-            continue;
-        }
-        while (true);
-    }
-""")
-
-
-@pytest.mark.parametrize("code,should_fail", [
-    (IF_WITH_BRACES, False),
-    (IF_WITHOUT_BRACES, True),
-    (ELSE_WITH_BRACES, False),
-    (ELSE_WITHOUT_BRACES, True),
-    (DO_WITH_BRACES, False),
-    (DO_WITHOUT_BRACES, True),
-], ids=["if-with-braces-ok", "if-without-braces-bad",
-        "else-with-braces-ok", "else-without-braces-bad",
-        "do-with-braces-ok", "do-without-braces-bad"])
+
+BRACES_SINGLE_EXP_CASES = (
+    pytest.param(IF_WITH_BRACES, False, id="if-with-braces-ok"),
+    pytest.param(IF_WITHOUT_BRACES, True, id="if-without-braces-bad"),
+    pytest.param(ELSE_WITH_BRACES, False, id="else-with-braces-ok"),
+    pytest.param(ELSE_WITHOUT_BRACES, True, id="else-without-braces-bad"),
+    pytest.param(DO_WITH_BRACES, False, id="do-with-braces-ok"),
+    pytest.param(DO_WITHOUT_BRACES, True, id="do-without-braces-bad"),
+)
+
+
+@pytest.mark.parametrize("code,should_fail", BRACES_SINGLE_EXP_CASES)
 def test_braces_single_exp(check_cxx, code, should_fail):
     assert check_cxx(code, "braces.single_exp") == should_fail
 
@@ -109,48 +112,54 @@ THROW_EXCEPTION = '#include <stdexcept>\nvoid foo() { throw std::runtime_error("
 THROW_NEW = '#include <stdexcept>\nvoid foo() { throw new std::runtime_error("err"); }\n'
 
 
-@pytest.mark.parametrize("code,should_fail", [
-    (THROW_EXCEPTION, False),
-    (THROW_INTEGER, True),
-    (THROW_STRING, True),
-    (THROW_NEW, True),
-], ids=["exception-ok", "integer-bad", "string-bad", "throw-new-bad"])
+ERR_THROW_CASES = (
+    pytest.param(THROW_EXCEPTION, False, id="exception-ok"),
+    pytest.param(THROW_INTEGER, True, id="integer-bad"),
+    pytest.param(THROW_STRING, True, id="string-bad"),
+    pytest.param(THROW_NEW, True, id="throw-new-bad"),
+)
+
+
+@pytest.mark.parametrize("code,should_fail", ERR_THROW_CASES)
 def test_err_throw(check_cxx, code, should_fail):
     assert check_cxx(code, "err.throw") == should_fail
 
 
 # ── err.throw.catch ──────────────────────────────────────────────────────
 
-CATCH_BY_VALUE = dedent("""\
-    void foo()
-    {
-        try { throw 1; }
-        catch (int x) {}
-    }
-""")
-
-CATCH_BY_REF = dedent("""\
-    void foo()
-    {
-        try { throw 1; }
-        catch (const int& x) {}
-    }
-""")
-
-CATCH_ELLIPSIS = dedent("""\
-    void foo()
-    {
-        try { throw 1; }
-        catch (...) {}
-    }
-""")
-
-
-@pytest.mark.parametrize("code,should_fail", [
-    (CATCH_BY_REF, False),
-    (CATCH_ELLIPSIS, False),
-    (CATCH_BY_VALUE, True),
-], ids=["by-ref-ok", "ellipsis-ok", "by-value-bad"])
+CATCH_BY_VALUE = """\
+void foo()
+{
+    try { throw 1; }
+    catch (int x) {}
+}
+"""
+
+CATCH_BY_REF = """\
+void foo()
+{
+    try { throw 1; }
+    catch (const int& x) {}
+}
+"""
+
+CATCH_ELLIPSIS = """\
+void foo()
+{
+    try { throw 1; }
+    catch (...) {}
+}
+"""
+
+
+ERR_THROW_CATCH_CASES = (
+    pytest.param(CATCH_BY_REF, False, id="by-ref-ok"),
+    pytest.param(CATCH_ELLIPSIS, False, id="ellipsis-ok"),
+    pytest.param(CATCH_BY_VALUE, True, id="by-value-bad"),
+)
+
+
+@pytest.mark.parametrize("code,should_fail", ERR_THROW_CATCH_CASES)
 def test_err_throw_catch(check_cxx, code, should_fail):
     assert check_cxx(code, "err.throw.catch") == should_fail
 
@@ -161,51 +170,57 @@ THROW_WITH_PARENS = '#include <stdexcept>\nvoid foo() { throw(std::runtime_error
 THROW_WITHOUT_PARENS = '#include <stdexcept>\nvoid foo() { throw std::runtime_error("err"); }\n'
 
 
-@pytest.mark.parametrize("code,should_fail", [
-    (THROW_WITHOUT_PARENS, False),
-    (THROW_WITH_PARENS, True),
-], ids=["no-parens-ok", "parens-bad"])
+ERR_THROW_PAREN_CASES = (
+    pytest.param(THROW_WITHOUT_PARENS, False, id="no-parens-ok"),
+    pytest.param(THROW_WITH_PARENS, True, id="parens-bad"),
+)
+
+
+@pytest.mark.parametrize("code,should_fail", ERR_THROW_PAREN_CASES)
 def test_err_throw_paren(check_cxx, code, should_fail):
     assert check_cxx(code, "err.throw.paren") == should_fail
 
 
 # ── exp.padding ──────────────────────────────────────────────────────────
 
-OPERATOR_WITH_SPACE = dedent("""\
-    class Foo
-    {
-        bool operator ==(const Foo& o);
-    };
-""")
-
-OPERATOR_NO_SPACE = dedent("""\
-    class Foo
-    {
-        bool operator==(const Foo& o);
-    };
-""")
-
-OPERATOR_CAST_BOOL = dedent("""\
-    class Foo
-    {
-        operator bool() const;
-    };
-""")
-
-OPERATOR_CAST_INT = dedent("""\
-    class Foo
-    {
-        operator int() const;
-    };
-""")
-
-
-@pytest.mark.parametrize("code,should_fail", [
-    (OPERATOR_NO_SPACE, False),
-    (OPERATOR_WITH_SPACE, True),
-    (OPERATOR_CAST_BOOL, False),
-    (OPERATOR_CAST_INT, False),
-], ids=["no-space-ok", "space-bad", "cast-bool-ok", "cast-int-ok"])
+OPERATOR_WITH_SPACE = """\
+class Foo
+{
+    bool operator ==(const Foo& o);
+};
+"""
+
+OPERATOR_NO_SPACE = """\
+class Foo
+{
+    bool operator==(const Foo& o);
+};
+"""
+
+OPERATOR_CAST_BOOL = """\
+class Foo
+{
+    operator bool() const;
+};
+"""
+
+OPERATOR_CAST_INT = """\
+class Foo
+{
+    operator int() const;
+};
+"""
+
+
+EXP_PADDING_CASES = (
+    pytest.param(OPERATOR_NO_SPACE, False, id="no-space-ok"),
+    pytest.param(OPERATOR_WITH_SPACE, True, id="space-bad"),
+    pytest.param(OPERATOR_CAST_BOOL, False, id="cast-bool-ok"),
+    pytest.param(OPERATOR_CAST_INT, False, id="cast-int-ok"),
+)
+
+
+@pytest.mark.parametrize("code,should_fail", EXP_PADDING_CASES)
 def test_exp_padding(check_cxx, code, should_fail):
     assert check_cxx(code, "exp.padding") == should_fail
 
@@ -217,114 +232,122 @@ EMPTY_PARAMS = "void foo() {}\n"
 VOID_IN_DECL = "void foo(void);\n"
 
 
-@pytest.mark.parametrize("code,should_fail", [
-    (EMPTY_PARAMS, False),
-    (VOID_PARAMS, True),
-    (VOID_IN_DECL, True),
-], ids=["empty-params-ok", "void-params-bad", "void-in-decl-bad"])
+FUN_PROTO_VOID_CXX_CASES = (
+    pytest.param(EMPTY_PARAMS, False, id="empty-params-ok"),
+    pytest.param(VOID_PARAMS, True, id="void-params-bad"),
+    pytest.param(VOID_IN_DECL, True, id="void-in-decl-bad"),
+)
+
+
+@pytest.mark.parametrize("code,should_fail", FUN_PROTO_VOID_CXX_CASES)
 def test_fun_proto_void_cxx(check_cxx, code, should_fail):
     assert check_cxx(code, "fun.proto.void.cxx") == should_fail
 
 
 # ── op.assign ────────────────────────────────────────────────────────────
 
-ASSIGN_NO_REF_RETURN = dedent("""\
-    class Foo
-    {
-        Foo operator=(const Foo& o) { return *this; }
-    };
-""")
-
-ASSIGN_CORRECT = dedent("""\
-    class Foo
-    {
-        Foo& operator=(const Foo& o) { return *this; }
-    };
-""")
-
-ASSIGN_MISSING_THIS = dedent("""\
-    class Foo
-    {
-        Foo& operator=(const Foo& o) { return o; }
-    };
-""")
-
-ASSIGN_EQUALITY_NOT_ASSIGN = dedent("""\
-    class Foo
-    {
-        bool operator==(const Foo& o) const { return true; }
-    };
-""")
-
-ASSIGN_COMPOUND_NOT_ASSIGN = dedent("""\
-    class Foo
-    {
-        Foo& operator+=(const Foo& o) { return *this; }
-    };
-""")
-
-
-@pytest.mark.parametrize("code,should_fail", [
-    (ASSIGN_CORRECT, False),
-    (ASSIGN_NO_REF_RETURN, True),
-    (ASSIGN_MISSING_THIS, True),
-    (ASSIGN_EQUALITY_NOT_ASSIGN, False),
-    (ASSIGN_COMPOUND_NOT_ASSIGN, False),
-], ids=["correct-ok", "no-ref-return-bad", "missing-this-bad",
-        "equality-not-assign-ok", "compound-not-assign-ok"])
+ASSIGN_NO_REF_RETURN = """\
+class Foo
+{
+    Foo operator=(const Foo& o) { return *this; }
+};
+"""
+
+ASSIGN_CORRECT = """\
+class Foo
+{
+    Foo& operator=(const Foo& o) { return *this; }
+};
+"""
+
+ASSIGN_MISSING_THIS = """\
+class Foo
+{
+    Foo& operator=(const Foo& o) { return o; }
+};
+"""
+
+ASSIGN_EQUALITY_NOT_ASSIGN = """\
+class Foo
+{
+    bool operator==(const Foo& o) const { return true; }
+};
+"""
+
+ASSIGN_COMPOUND_NOT_ASSIGN = """\
+class Foo
+{
+    Foo& operator+=(const Foo& o) { return *this; }
+};
+"""
+
+
+OP_ASSIGN_CASES = (
+    pytest.param(ASSIGN_CORRECT, False, id="correct-ok"),
+    pytest.param(ASSIGN_NO_REF_RETURN, True, id="no-ref-return-bad"),
+    pytest.param(ASSIGN_MISSING_THIS, True, id="missing-this-bad"),
+    pytest.param(ASSIGN_EQUALITY_NOT_ASSIGN, False, id="equality-not-assign-ok"),
+    pytest.param(ASSIGN_COMPOUND_NOT_ASSIGN, False, id="compound-not-assign-ok"),
+)
+
+
+@pytest.mark.parametrize("code,should_fail", OP_ASSIGN_CASES)
 def test_op_assign(check_cxx, code, should_fail):
     assert check_cxx(code, "op.assign") == should_fail
 
 
 # ── op.overload ──────────────────────────────────────────────────────────
 
-OVERLOAD_COMMA = dedent("""\
-    class Foo
-    {
-        Foo operator,(const Foo& o);
-    };
-""")
-
-OVERLOAD_LOGICAL_OR = dedent("""\
-    class Foo
-    {
-        bool operator||(const Foo& o);
-    };
-""")
-
-OVERLOAD_LOGICAL_AND = dedent("""\
-    class Foo
-    {
-        bool operator&&(const Foo& o);
-    };
-""")
-
-OVERLOAD_PLUS = dedent("""\
-    class Foo
-    {
-        Foo operator+(const Foo& o);
-    };
-""")
-
-
-@pytest.mark.parametrize("code,should_fail", [
-    (OVERLOAD_PLUS, False),
-    (OVERLOAD_COMMA, True),
-    (OVERLOAD_LOGICAL_OR, True),
-    (OVERLOAD_LOGICAL_AND, True),
-], ids=["plus-ok", "comma-bad", "logical-or-bad", "logical-and-bad"])
+OVERLOAD_COMMA = """\
+class Foo
+{
+    Foo operator,(const Foo& o);
+};
+"""
+
+OVERLOAD_LOGICAL_OR = """\
+class Foo
+{
+    bool operator||(const Foo& o);
+};
+"""
+
+OVERLOAD_LOGICAL_AND = """\
+class Foo
+{
+    bool operator&&(const Foo& o);
+};
+"""
+
+OVERLOAD_PLUS = """\
+class Foo
+{
+    Foo operator+(const Foo& o);
+};
+"""
+
+
+OP_OVERLOAD_CASES = (
+    pytest.param(OVERLOAD_PLUS, False, id="plus-ok"),
+    pytest.param(OVERLOAD_COMMA, True, id="comma-bad"),
+    pytest.param(OVERLOAD_LOGICAL_OR, True, id="logical-or-bad"),
+    pytest.param(OVERLOAD_LOGICAL_AND, True, id="logical-and-bad"),
+)
+
+
+@pytest.mark.parametrize("code,should_fail", OP_OVERLOAD_CASES)
 def test_op_overload(check_cxx, code, should_fail):
     assert check_cxx(code, "op.overload") == should_fail
 
 
 # ── op.overload.binand ──────────────────────────────────────────────────
 
-OVERLOAD_ADDRESS_OF = dedent("""\
-    class Foo
-    {
-        Foo* operator&();
-    };
-""")
+OVERLOAD_ADDRESS_OF = """\
+class Foo
+{
+    Foo* operator&();
+};
+"""
 
 
 def test_op_overload_binand(check_cxx):
@@ -337,100 +360,96 @@ PLAIN_ENUM = "enum Color { Red, Green, Blue };\n"
 ENUM_CLASS = "enum class Color { Red, Green, Blue };\n"
 
 
-@pytest.mark.parametrize("code,should_fail", [
-    (ENUM_CLASS, False),
-    (PLAIN_ENUM, True),
-], ids=["enum-class-ok", "plain-enum-bad"])
+ENUM_CLASS_CASES = (
+    pytest.param(ENUM_CLASS, False, id="enum-class-ok"),
+    pytest.param(PLAIN_ENUM, True, id="plain-enum-bad"),
+)
+
+
+@pytest.mark.parametrize("code,should_fail", ENUM_CLASS_CASES)
 def test_enum_class(check_cxx, code, should_fail):
     assert check_cxx(code, "enum.class") == should_fail
 
 
 # ── exp.linebreak ───────────────────────────────────────────────────────
 
-OPERATOR_END_OF_LINE = dedent("""\
-    void foo()
-    {
-        int x = 1 +
-            2;
-    }
-""")
-
-OPERATOR_START_OF_NEXT = dedent("""\
-    void foo()
-    {
-        int x = 1
-            + 2;
-    }
-""")
-
-
-TEMPLATE_CLOSING_ANGLE = dedent("""\
-    template <typename Lhs, typename Rhs>
-    class Bimap
-    {};
-""")
-
-TEMPLATE_FUNCTION = dedent("""\
-    template <typename Lhs, typename Rhs>
-    auto foo(const Lhs& a, const Rhs& b) -> bool
-    {
-        return true;
-    }
-""")
-
-REFERENCE_RETURN_TYPE = dedent("""\
-    template <typename T>
-    auto get() const -> const std::map<int, T>&
-    {
-        return m_;
-    }
-""")
-
-REFERENCE_PARAM = dedent("""\
-    void foo(const std::string& s)
-    {}
-""")
-
-NESTED_TEMPLATE = dedent("""\
-    std::map<int, std::map<int, int>> m;
-""")
-
-POINTER_RETURN_TYPE = dedent("""\
-    int* get()
-    {
-        return nullptr;
-    }
-""")
-
-REAL_BINARY_OP_AT_EOL = dedent("""\
-    void foo()
-    {
-        bool x = a &&
-            b;
-    }
-""")
-
-
-@pytest.mark.parametrize("code,should_fail", [
-    (OPERATOR_START_OF_NEXT, False),
-    (OPERATOR_END_OF_LINE, True),
-    (TEMPLATE_CLOSING_ANGLE, False),
-    (TEMPLATE_FUNCTION, False),
-    (REFERENCE_RETURN_TYPE, False),
-    (REFERENCE_PARAM, False),
-    (NESTED_TEMPLATE, False),
-    (POINTER_RETURN_TYPE, False),
-    (REAL_BINARY_OP_AT_EOL, True),
-], ids=[
-    "start-of-next-ok",
-    "end-of-line-bad",
-    "template-closing-angle-ok",
-    "template-function-ok",
-    "reference-return-type-ok",
-    "reference-param-ok",
-    "nested-template-ok",
-    "pointer-return-type-ok",
-    "real-binary-op-at-eol-bad",
-])
+OPERATOR_END_OF_LINE = """\
+void foo()
+{
+    int x = 1 +
+        2;
+}
+"""
+
+OPERATOR_START_OF_NEXT = """\
+void foo()
+{
+    int x = 1
+        + 2;
+}
+"""
+
+
+TEMPLATE_CLOSING_ANGLE = """\
+template <typename Lhs, typename Rhs>
+class Bimap
+{};
+"""
+
+TEMPLATE_FUNCTION = """\
+template <typename Lhs, typename Rhs>
+auto foo(const Lhs& a, const Rhs& b) -> bool
+{
+    return true;
+}
+"""
+
+REFERENCE_RETURN_TYPE = """\
+template <typename T>
+auto get() const -> const std::map<int, T>&
+{
+    return m_;
+}
+"""
+
+REFERENCE_PARAM = """\
+void foo(const std::string& s)
+{}
+"""
+
+NESTED_TEMPLATE = """\
+std::map<int, std::map<int, int>> m;
+"""
+
+POINTER_RETURN_TYPE = """\
+int* get()
+{
+    return nullptr;
+}
+"""
+
+REAL_BINARY_OP_AT_EOL = """\
+void foo()
+{
+    bool x = a &&
+        b;
+}
+"""
+
+
+EXP_LINEBREAK_CASES = (
+    pytest.param(OPERATOR_START_OF_NEXT, False, id="start-of-next-ok"),
+    pytest.param(OPERATOR_END_OF_LINE, True, id="end-of-line-bad"),
+    pytest.param(TEMPLATE_CLOSING_ANGLE, False, id="template-closing-angle-ok"),
+    pytest.param(TEMPLATE_FUNCTION, False, id="template-function-ok"),
+    pytest.param(REFERENCE_RETURN_TYPE, False, id="reference-return-type-ok"),
+    pytest.param(REFERENCE_PARAM, False, id="reference-param-ok"),
+    pytest.param(NESTED_TEMPLATE, False, id="nested-template-ok"),
+    pytest.param(POINTER_RETURN_TYPE, False, id="pointer-return-type-ok"),
+    pytest.param(REAL_BINARY_OP_AT_EOL, True, id="real-binary-op-at-eol-bad"),
+)
+
+
+@pytest.mark.parametrize("code,should_fail", EXP_LINEBREAK_CASES)
 def test_exp_linebreak(check_cxx, code, should_fail):
     assert check_cxx(code, "exp.linebreak") == should_fail
@@ -4,12 +4,15 @@ import pytest
 from textwrap import dedent
 
 
-@pytest.mark.parametrize("code,should_fail", [
-    ("int x;\n", False),
-    ("int x = 1;\n", False),
-    ("int x, y;\n", True),
-    ("int *x, *y;\n", True),
-], ids=["single-decl", "single-init", "multi-decl", "multi-ptr-decl"])
+DECL_SINGLE_CASES = (
+    pytest.param("int x;\n", False, id="single-decl"),
+    pytest.param("int x = 1;\n", False, id="single-init"),
+    pytest.param("int x, y;\n", True, id="multi-decl"),
+    pytest.param("int *x, *y;\n", True, id="multi-ptr-decl"),
+)
+
+
+@pytest.mark.parametrize("code,should_fail", DECL_SINGLE_CASES)
 def test_decl_single(check, code, should_fail):
     assert check(code, "decl.single") == should_fail
 
@@ -63,21 +66,21 @@ COND_ARRAY_ACCESS = dedent("""\
 """)
 
 
-@pytest.mark.parametrize("code,should_fail", [
+DECL_VLA_CASES = (
     # Should NOT trigger (not VLAs)
-    ("void f(void) { int arr[10]; }\n", False),
-    (VLA_MACRO_OK, False),
-    (RETURN_ARRAY_ACCESS, False),
-    (ASSIGN_ARRAY_ACCESS, False),
-    (FUNCALL_ARRAY_ACCESS, False),
-    (COND_ARRAY_ACCESS, False),
+    pytest.param("void f(void) { int arr[10]; }\n", False, id="fixed-size"),
+    pytest.param(VLA_MACRO_OK, False, id="macro-size"),
+    pytest.param(RETURN_ARRAY_ACCESS, False, id="return-access"),
+    pytest.param(ASSIGN_ARRAY_ACCESS, False, id="assign-access"),
+    pytest.param(FUNCALL_ARRAY_ACCESS, False, id="funcall-access"),
+    pytest.param(COND_ARRAY_ACCESS, False, id="cond-access"),
     # Should trigger (actual VLAs)
-    ("void f(int n) { int arr[n]; }\n", True),
-    ("void f(int n) { char buf[n]; }\n", True),
-    ("void f(int n) { int mat[n]; }\n", True),
-], ids=[
-    "fixed-size", "macro-size", "return-access", "assign-access",
-    "funcall-access", "cond-access", "vla-int", "vla-char", "vla-mat",
-])
+    pytest.param("void f(int n) { int arr[n]; }\n", True, id="vla-int"),
+    pytest.param("void f(int n) { char buf[n]; }\n", True, id="vla-char"),
+    pytest.param("void f(int n) { int mat[n]; }\n", True, id="vla-mat"),
+)
+
+
+@pytest.mark.parametrize("code,should_fail", DECL_VLA_CASES)
 def test_decl_vla(check, code, should_fail):
     assert check(code, "decl.vla") == should_fail
@@ -1,10 +1,13 @@
 """Tests for export rules."""
 
+from dataclasses import replace
+from functools import cache
+
 import pytest
-from textwrap import dedent
 from epita_coding_style import Severity
 
 
+@cache
 def _make_funcs(n, static=False):
     """Generate n functions."""
     prefix = "static " if static else ""
@@ -14,6 +17,7 @@ def _make_funcs(n, static=False):
     ) + "\n"
 
 
+@cache
 def _make_mixed_funcs(n_exported, n_static):
     """Generate a mix of exported and static functions."""
     exported = "\n".join(
@@ -27,6 +31,7 @@ def _make_mixed_funcs(n_exported, n_static):
     return exported + "\n" + static + "\n"
 
 
+@cache
 def _make_multiline_funcs(n):
     """Generate n functions with multi-line signatures."""
     return "\n".join(
@@ -35,136 +40,147 @@ def _make_multiline_funcs(n):
     ) + "\n"
 
 
+@cache
+def _make_ptr_return_funcs(n):
+    """Generate n exported functions with pointer return types."""
+    return "\n".join(
+        f"int *pfunc{i}(void)\n{{\n    return 0;\n}}"
+        for i in range(n)
+    ) + "\n"
+
+
 # =============================================================================
 # export.fun: max 10 exported functions per .c file
 # =============================================================================
 
-@pytest.mark.parametrize("code,should_fail", [
-    (_make_funcs(10), False),
-    (_make_funcs(11), True),
-    (_make_funcs(15, static=True), False),
-    (_make_multiline_funcs(10), False),
-    (_make_multiline_funcs(11), True),
-    (_make_mixed_funcs(10, 5), False),  # 10 exported + 5 static = OK
-    (_make_mixed_funcs(11, 5), True),   # 11 exported + 5 static = fail
-], ids=["10-ok", "11-fail", "15-static-ok", "10-multiline-ok",
-        "11-multiline-fail", "10+5-mixed-ok", "11+5-mixed-fail"])
-def test_export_fun(check, code, should_fail):
-    assert check(code, "export.fun") == should_fail
+@pytest.mark.parametrize("n", range(16))
+def test_export_fun_limit(check, n):
+    """Up to 10 exported functions pass, the 11th is one too many."""
+    assert check(_make_funcs(n), "export.fun") == (n > 10)
 
 
-def test_export_fun_header_not_checked(check):
-    assert not check(_make_funcs(11), "export.fun", suffix=".h")
+EXPORT_FUN_CASES = (
+    pytest.param(_make_funcs(15, static=True), False, id="15-static-ok"),
+    pytest.param(_make_multiline_funcs(10), False, id="10-multiline-ok"),
+    pytest.param(_make_multiline_funcs(11), True, id="11-multiline-fail"),
+    pytest.param(_make_mixed_funcs(10, 5), False, id="10+5-mixed-ok"),  # 10 exported + 5 static = OK
+    pytest.param(_make_mixed_funcs(11, 5), True, id="11+5-mixed-fail"),  # 11 exported + 5 static = fail
+    # Regression: functions with pointer return types must be counted
+    pytest.param(_make_ptr_return_funcs(10), False, id="10-ptr-return-ok"),
+    pytest.param(_make_ptr_return_funcs(11), True, id="11-ptr-return-fail"),
+)
 
 
-def test_export_fun_is_major(check_result):
-    violations = [v for v in check_result(_make_funcs(11)) if v.rule == "export.fun"]
-    assert violations and all(v.severity == Severity.MAJOR for v in violations)
+@pytest.mark.parametrize("code,should_fail", EXPORT_FUN_CASES)
+def test_export_fun(check, code, should_fail):
+    assert check(code, "export.fun") == should_fail
 
 
 # =============================================================================
 # export.other: max 1 exported global per .c file
 # =============================================================================
 
-STATIC_VARS = dedent("""\
-    static int a;
-    static int b;
-""")
-
-EXTERN_VARS = dedent("""\
-    extern int a;
-    extern int b;
-""")
-
-LOCAL_VARS = dedent("""\
-    void f(void)
-    {
-        int i;
-        int j;
-    }
-""")
-
-STRUCT_DEF = dedent("""\
-    struct foo {
-        int a;
-        int b;
-    };
-""")
-
-TYPEDEF_DEF = dedent("""\
-    typedef int myint;
-    typedef char mychar;
-""")
-
-PROTO_DEF = dedent("""\
-    int f1(void);
-    int f2(void);
-""")
-
-CONST_STATIC = dedent("""\
-    const static int a = 1;
-    const static int b = 2;
-""")
-
-CHAR_BRACE_LOCAL = dedent("""\
-    void f(void)
-    {
-        char c = '}';
-        int i;
-        int j;
-    }
-""")
-
-STRING_BRACE_LOCAL = dedent("""\
-    void f(void)
-    {
-        char *s = "}}}{{";
-        int i;
-        int j;
-    }
-""")
-
-
-@pytest.mark.parametrize("code,should_fail", [
-    ("int global_var;\n", False),
-    ("int a;\nint b;\n", True),
-], ids=["one-global-ok", "two-globals-fail"])
+STATIC_VARS = """\
+static int a;
+static int b;
+"""
+
+EXTERN_VARS = """\
+extern int a;
+extern int b;
+"""
+
+LOCAL_VARS = """\
+void f(void)
+{
+    int i;
+    int j;
+}
+"""
+
+STRUCT_DEF = """\
+struct foo {
+    int a;
+    int b;
+};
+"""
+
+TYPEDEF_DEF = """\
+typedef int myint;
+typedef char mychar;
+"""
+
+PROTO_DEF = """\
+int f1(void);
+int f2(void);
+"""
+
+CONST_STATIC = """\
+const static int a = 1;
+const static int b = 2;
+"""
+
+CHAR_BRACE_LOCAL = """\
+void f(void)
+{
+    char c = '}';
+    int i;
+    int j;
+}
+"""
+
+STRING_BRACE_LOCAL = """\
+void f(void)
+{
+    char *s = "}}}{{";
+    int i;
+    int j;
+}
+"""
+
+
+EXPORT_OTHER_CASES = (
+    pytest.param("int global_var;\n", False, id="one-global-ok"),
+    pytest.param("int a;\nint b;\n", True, id="two-globals-fail"),
+    # Not exported globals: never counted
+    pytest.param(STATIC_VARS, False, id="static"),
+    pytest.param(EXTERN_VARS, False, id="extern"),
+    pytest.param(LOCAL_VARS, False, id="local"),
+    pytest.param(STRUCT_DEF, False, id="struct"),
+    pytest.param(TYPEDEF_DEF, False, id="typedef"),
+    pytest.param(PROTO_DEF, False, id="proto"),
+    pytest.param(CONST_STATIC, False, id="const-static"),
+    pytest.param(CHAR_BRACE_LOCAL, False, id="char-brace"),
+    pytest.param(STRING_BRACE_LOCAL, False, id="string-brace"),
+    # Every exported global counts, whatever its type
+    pytest.param("const int a = 1;\nconst int b = 2;\n", True, id="const-globals"),
+    pytest.param("int *a;\nint *b;\n", True, id="ptr-globals"),
+    pytest.param("int a[10];\nint b[20];\n", True, id="array-globals"),
+    pytest.param("char c = '{';\nint a;\nint b;\n", True, id="char-brace-globals"),
+)
+
+
+@pytest.mark.parametrize("code,should_fail", EXPORT_OTHER_CASES)
 def test_export_other(check, code, should_fail):
     assert check(code, "export.other") == should_fail
 
 
-@pytest.mark.parametrize("code", [
-    STATIC_VARS,
-    EXTERN_VARS,
-    LOCAL_VARS,
-    STRUCT_DEF,
-    TYPEDEF_DEF,
-    PROTO_DEF,
-    CONST_STATIC,
-    CHAR_BRACE_LOCAL,
-    STRING_BRACE_LOCAL,
-], ids=["static", "extern", "local", "struct", "typedef",
-        "proto", "const-static", "char-brace", "string-brace"])
-def test_export_other_not_exported(check, code):
-    assert not check(code, "export.other")
-
+# One snippet per rule that exceeds its limit in a .c file
+OVER_LIMIT_CASES = (
+    pytest.param("export.fun", _make_funcs(11), id="export-fun"),
+    pytest.param("export.other", "int a;\nint b;\n", id="export-other"),
+)
 
-@pytest.mark.parametrize("code", [
-    "const int a = 1;\nconst int b = 2;\n",
-    "int *a;\nint *b;\n",
-    "int a[10];\nint b[20];\n",
-    "char c = '{';\nint a;\nint b;\n",
-], ids=["const-globals", "ptr-globals", "array-globals", "char-brace-globals"])
-def test_export_other_multiple_globals(check, code):
-    assert check(code, "export.other")
 
+@pytest.mark.parametrize("rule,code", OVER_LIMIT_CASES)
+def test_export_header_not_checked(check, rule, code):
+    """Export limits only apply to .c files."""
+    assert not check(code, rule, suffix=".h")
 
-def test_export_other_header_not_checked(check):
-    assert not check("int a;\nint b;\n", "export.other", suffix=".h")
 
-
-def test_export_other_is_major(check_result):
-    violations = [v for v in check_result("int a;\nint b;\n") if v.rule == "export.other"]
+@pytest.mark.parametrize("rule,code", OVER_LIMIT_CASES)
+def test_export_is_major(check_result, rule, code):
+    violations = check_result(code, rule)
     assert violations and all(v.severity == Severity.MAJOR for v in violations)
 
 
@@ -172,25 +188,8 @@ def test_export_other_max_globals_zero(tmp_path):
     """Regression: max_globals=0 must not crash with IndexError."""
     from epita_coding_style import check_file, Config
     path = tmp_path / "test.c"
-    path.write_text("int a;\n")
-    cfg = Config()
-    cfg.max_globals = 0
+    path.write_bytes(b"int a;\n")
+    cfg = replace(Config(), max_globals=0)
     violations = [v for v in check_file(str(path), cfg) if v.rule == "export.other"]
     assert len(violations) == 1
 
-
-def _make_ptr_return_funcs(n):
-    """Generate n exported functions with pointer return types."""
-    return "\n".join(
-        f"int *pfunc{i}(void)\n{{\n    return 0;\n}}"
-        for i in range(n)
-    ) + "\n"
-
-
-@pytest.mark.parametrize("code,should_fail", [
-    (_make_ptr_return_funcs(10), False),
-    (_make_ptr_return_funcs(11), True),
-], ids=["10-ptr-return-ok", "11-ptr-return-fail"])
-def test_export_fun_pointer_return(check, code, should_fail):
-    """Regression: functions with pointer return types must be counted."""
-    assert check(code, "export.fun") == should_fail
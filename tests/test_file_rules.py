@@ -1,45 +1,65 @@
 """Tests for file-level rules."""
 
 import pytest
+from epita_coding_style import check_file
 
 
-@pytest.mark.parametrize("code,should_fail", [
-    ("int x = 1;\n", False),
-    ("int x = 1;   \n", True),
-    ("int x = 1;\t\n", True),
-], ids=["clean", "trailing-spaces", "trailing-tab"])
+TRAILING_WHITESPACE_CASES = (
+    pytest.param("int x = 1;\n", False, id="clean"),
+    pytest.param("int x = 1;   \n", True, id="trailing-spaces"),
+    pytest.param("int x = 1;\t\n", True, id="trailing-tab"),
+)
+
+
+@pytest.mark.parametrize("code,should_fail", TRAILING_WHITESPACE_CASES)
 def test_trailing_whitespace(check, code, should_fail):
     assert check(code, "file.trailing") == should_fail
 
 
-@pytest.mark.parametrize("code,should_fail", [
-    ("int x = 1;\n", False),
-    ("int x = 1;", True),
-], ids=["newline", "no-newline"])
+FILE_TERMINATE_CASES = (
+    pytest.param("int x = 1;\n", False, id="newline"),
+    pytest.param("int x = 1;", True, id="no-newline"),
+)
+
+
+@pytest.mark.parametrize("code,should_fail", FILE_TERMINATE_CASES)
 def test_file_terminate(check, code, should_fail):
     assert check(code, "file.terminate") == should_fail
 
 
-@pytest.mark.parametrize("code,should_fail", [
-    ("int x = 1;\nint y = 2;\n", False),
-    ("int x = 1;\r\nint y = 2;\r\n", True),
-], ids=["unix-lf", "dos-crlf"])
-def test_file_dos(check, code, should_fail):
-    assert check(code, "file.dos") == should_fail
+FILE_DOS_CASES = (
+    pytest.param(b"int x = 1;\nint y = 2;\n", False, id="unix-lf"),
+    pytest.param(b"int x = 1;\r\nint y = 2;\r\n", True, id="dos-crlf"),
+)
+
 
+@pytest.mark.parametrize("code,should_fail", FILE_DOS_CASES)
+def test_file_dos(tmp_path, preset_config, code, should_fail):
+    """Checked through check_file on a real file, so CRLF survives the disk read."""
+    path = tmp_path / "test.c"
+    path.write_bytes(code)
+    violations = check_file(str(path), preset_config("42sh"))
+    assert any(v.rule == "file.dos" for v in violations) == should_fail
 
-@pytest.mark.parametrize("code,should_fail", [
-    ("int x = 1;\n", False),
-    ("\nint x = 1;\n", True),
-    ("int x = 1;\n\n", True),
-], ids=["clean", "leading-blank", "trailing-blank"])
+
+FILE_SPURIOUS_CASES = (
+    pytest.param("int x = 1;\n", False, id="clean"),
+    pytest.param("\nint x = 1;\n", True, id="leading-blank"),
+    pytest.param("int x = 1;\n\n", True, id="trailing-blank"),
+)
+
+
+@pytest.mark.parametrize("code,should_fail", FILE_SPURIOUS_CASES)
 def test_file_spurious(check, code, should_fail):
     assert check(code, "file.spurious") == should_fail
 
 
-@pytest.mark.parametrize("code,should_fail", [
-    ("int a;\n\nint b;\n", False),
-    ("int a;\n\n\nint b;\n", True),
-], ids=["single-blank", "double-blank"])
+LINES_EMPTY_CASES = (
+    pytest.param("int a;\n\nint b;\n", False, id="single-blank"),
+    pytest.param("int a;\n\n\nint b;\n", True, id="double-blank"),
+)
+
+
+@pytest.mark.parametrize("code,should_fail", LINES_EMPTY_CASES)
 def test_lines_empty(check, code, should_fail):
     assert check(code, "lines.empty") == should_fail
@@ -1,15 +1,10 @@
 """Tests for clang-format rule with separate C and C++ configs."""
 
-import shutil
 import pytest
 from epita_coding_style.core import Severity
 
-
-# Skip all tests if clang-format not installed
-pytestmark = pytest.mark.skipif(
-    not shutil.which("clang-format"),
-    reason="clang-format not installed"
-)
+# Tests needing clang-format go through format_check, which depends on the
+# requires_clang_format skip guard.
 
 
 # ── General ──────────────────────────────────────────────────────────────
@@ -75,17 +70,6 @@ void foo(void)
 """
 
 
-@pytest.mark.parametrize("code,suffix", [
-    (C_GOOD_MAIN, ".c"),
-    (C_GOOD_POINTER_RIGHT, ".c"),
-    (C_GOOD_HEADER, ".h"),
-    (C_GOOD_ALLMAN, ".c"),
-], ids=["main", "pointer-right", "header", "allman-braces"])
-def test_c_format_pass(format_passes, code, suffix):
-    """C: well-formatted code should pass."""
-    format_passes(code, suffix)
-
-
 # ── C: negative (should fail) ───────────────────────────────────────────
 
 
@@ -123,17 +107,6 @@ void foo(void)
 """
 
 
-@pytest.mark.parametrize("code,suffix", [
-    (C_BAD_KR_BRACES, ".c"),
-    (C_BAD_POINTER_LEFT, ".c"),
-    (C_BAD_HEADER, ".h"),
-    (C_BAD_MISSING_SPACES, ".c"),
-], ids=["kr-braces", "pointer-left", "header", "missing-spaces"])
-def test_c_format_fail(format_fails, code, suffix):
-    """C: badly formatted code should fail."""
-    format_fails(code, suffix)
-
-
 # ── C++: positive (should pass) ─────────────────────────────────────────
 
 
@@ -200,19 +173,6 @@ void foo()
 """
 
 
-@pytest.mark.parametrize("code,suffix", [
-    (CXX_GOOD_MAIN, ".cc"),
-    (CXX_GOOD_POINTER_LEFT, ".cc"),
-    (CXX_GOOD_REFERENCE_LEFT, ".cc"),
-    (CXX_GOOD_HH_HEADER, ".hh"),
-    (CXX_GOOD_HXX_HEADER, ".hxx"),
-    (CXX_GOOD_ALLMAN, ".cc"),
-], ids=["main", "pointer-left", "reference-left", "hh-header", "hxx-header", "allman-braces"])
-def test_cxx_format_pass(format_passes, code, suffix):
-    """C++: well-formatted code should pass."""
-    format_passes(code, suffix)
-
-
 # ── C++: negative (should fail) ─────────────────────────────────────────
 
 
@@ -257,16 +217,40 @@ void foo()
 """
 
 
-@pytest.mark.parametrize("code,suffix", [
-    (CXX_BAD_KR_BRACES, ".cc"),
-    (CXX_BAD_POINTER_RIGHT, ".cc"),
-    (CXX_BAD_REFERENCE_RIGHT, ".cc"),
-    (CXX_BAD_HH_HEADER, ".hh"),
-    (CXX_BAD_MISSING_SPACES, ".cc"),
-], ids=["kr-braces", "pointer-right", "reference-right", "hh-header", "missing-spaces"])
-def test_cxx_format_fail(format_fails, code, suffix):
-    """C++: badly formatted code should fail."""
-    format_fails(code, suffix)
+# ── All snippets: one table, expected outcome per row ───────────────────
+
+
+FORMAT_CASES = (
+    pytest.param(C_GOOD_MAIN, ".c", True, id="c-main"),
+    pytest.param(C_GOOD_POINTER_RIGHT, ".c", True, id="c-pointer-right"),
+    pytest.param(C_GOOD_HEADER, ".h", True, id="c-header"),
+    pytest.param(C_GOOD_ALLMAN, ".c", True, id="c-allman-braces"),
+    pytest.param(C_BAD_KR_BRACES, ".c", False, id="c-bad-kr-braces"),
+    pytest.param(C_BAD_POINTER_LEFT, ".c", False, id="c-bad-pointer-left"),
+    pytest.param(C_BAD_HEADER, ".h", False, id="c-bad-header"),
+    pytest.param(C_BAD_MISSING_SPACES, ".c", False, id="c-bad-missing-spaces"),
+    pytest.param(CXX_GOOD_MAIN, ".cc", True, id="cxx-main"),
+    pytest.param(CXX_GOOD_POINTER_LEFT, ".cc", True, id="cxx-pointer-left"),
+    pytest.param(CXX_GOOD_REFERENCE_LEFT, ".cc", True, id="cxx-reference-left"),
+    pytest.param(CXX_GOOD_HH_HEADER, ".hh", True, id="cxx-hh-header"),
+    pytest.param(CXX_GOOD_HXX_HEADER, ".hxx", True, id="cxx-hxx-header"),
+    pytest.param(CXX_GOOD_ALLMAN, ".cc", True, id="cxx-allman-braces"),
+    pytest.param(CXX_BAD_KR_BRACES, ".cc", False, id="cxx-bad-kr-braces"),
+    pytest.param(CXX_BAD_POINTER_RIGHT, ".cc", False, id="cxx-bad-pointer-right"),
+    pytest.param(CXX_BAD_REFERENCE_RIGHT, ".cc", False, id="cxx-bad-reference-right"),
+    pytest.param(CXX_BAD_HH_HEADER, ".hh", False, id="cxx-bad-hh-header"),
+    pytest.param(CXX_BAD_MISSING_SPACES, ".cc", False, id="cxx-bad-missing-spaces"),
+)
+
+
+@pytest.mark.parametrize("code,suffix,expected_pass", FORMAT_CASES)
+def test_format(format_check, code, suffix, expected_pass):
+    """Well-formatted snippets pass, badly formatted ones fail."""
+    has_violation, violations = format_check(code, suffix)
+    assert has_violation != expected_pass, (
+        f"{suffix} snippet expected to {'pass' if expected_pass else 'fail'} "
+        f"format check: {violations}"
+    )
 
 
 # ── Cross-language: pointer alignment divergence ────────────────────────
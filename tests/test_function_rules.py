@@ -1,114 +1,111 @@
 """Tests for function-level rules."""
 
 import pytest
-from textwrap import dedent
 from epita_coding_style import Severity
 
+# Statement bodies just under / over the fun.length limit (42sh: 40 lines)
+BODY_37 = "\n".join(["    x++;"] * 37)
+BODY_39 = "\n".join(["    x++;"] * 39)
+
 # Multi-line function signatures
-MULTILINE_6_ARGS = dedent("""\
-    void handle_unquoted(char **p, struct Ast_node *ast,
-                         struct Ast_node **current_cmd,
-                         struct Ast_node *merge_target, int *is_first,
-                         int *force_new)
-    {
-        return;
-    }
-""")
-
-MULTILINE_4_ARGS = dedent("""\
-    void foo(int a, int b,
-             int c, int d)
-    {
-        return;
-    }
-""")
-
-PROTO_VOID_OK = dedent("""\
-    #ifndef T_H
-    #define T_H
-    void f(void);
-    #endif /* T_H */
-""")
-
-PROTO_EMPTY = dedent("""\
-    #ifndef T_H
-    #define T_H
-    void f();
-    #endif /* T_H */
-""")
-
-
-@pytest.mark.parametrize("code,should_fail", [
-    ("void f(void) { return; }\n", False),
-    ("int f(int a, int b, int c, int d) { return 0; }\n", False),
-    ("int f(int a, int b, int c, int d, int e) { return 0; }\n", True),
-    (MULTILINE_4_ARGS, False),
-    (MULTILINE_6_ARGS, True),
-], ids=["void-ok", "4-args-ok", "5-args-fail", "multiline-4-ok", "multiline-6-fail"])
+MULTILINE_6_ARGS = """\
+void handle_unquoted(char **p, struct Ast_node *ast,
+                     struct Ast_node **current_cmd,
+                     struct Ast_node *merge_target, int *is_first,
+                     int *force_new)
+{
+    return;
+}
+"""
+
+MULTILINE_4_ARGS = """\
+void foo(int a, int b,
+         int c, int d)
+{
+    return;
+}
+"""
+
+PROTO_VOID_OK = """\
+#ifndef T_H
+#define T_H
+void f(void);
+#endif /* T_H */
+"""
+
+PROTO_EMPTY = """\
+#ifndef T_H
+#define T_H
+void f();
+#endif /* T_H */
+"""
+
+
+ARG_COUNT_CASES = (
+    pytest.param("void f(void) { return; }\n", False, id="void-ok"),
+    pytest.param("int f(int a, int b, int c, int d) { return 0; }\n", False, id="4-args-ok"),
+    pytest.param("int f(int a, int b, int c, int d, int e) { return 0; }\n", True, id="5-args-fail"),
+    pytest.param(MULTILINE_4_ARGS, False, id="multiline-4-ok"),
+    pytest.param(MULTILINE_6_ARGS, True, id="multiline-6-fail"),
+)
+
+
+@pytest.mark.parametrize("code,should_fail", ARG_COUNT_CASES)
 def test_arg_count(check, code, should_fail):
     assert check(code, "fun.arg.count") == should_fail
 
 
 def test_arg_count_is_major(check_result):
     code = "int f(int a, int b, int c, int d, int e) { return 0; }\n"
-    violations = [v for v in check_result(code) if v.rule == "fun.arg.count"]
+    violations = check_result(code, "fun.arg.count")
     assert violations and all(v.severity == Severity.MAJOR for v in violations)
 
 
 def test_func_length_40_ok(check):
-    body = "\n".join(["    x++;"] * 37)
-    code = f"void f(void)\n{{\n    int x = 0;\n{body}\n    return;\n}}\n"
+    code = f"void f(void)\n{{\n    int x = 0;\n{BODY_37}\n    return;\n}}\n"
     assert not check(code, "fun.length")
 
 
 def test_func_length_41_fail(check):
-    body = "\n".join(["    x++;"] * 39)
-    code = f"void f(void) {{\n    int x = 0;\n{body}\n    return;\n}}\n"
+    code = f"void f(void) {{\n    int x = 0;\n{BODY_39}\n    return;\n}}\n"
     assert check(code, "fun.length")
 
 
 # Test pointer return types (char *, int **, etc.)
-@pytest.mark.parametrize("return_type", [
-    "char *",
-    "int *",
-    "void *",
-    "char **",
-    "int ***",
-    "struct foo *",
-    "const char *",
-    "static char *",
-], ids=["char*", "int*", "void*", "char**", "int***",
-        "struct-foo*", "const-char*", "static-char*"])
+POINTER_RETURN_TYPES = (
+    pytest.param("char *", id="char*"),
+    pytest.param("int *", id="int*"),
+    pytest.param("void *", id="void*"),
+    pytest.param("char **", id="char**"),
+    pytest.param("int ***", id="int***"),
+    pytest.param("struct foo *", id="struct-foo*"),
+    pytest.param("const char *", id="const-char*"),
+    pytest.param("static char *", id="static-char*"),
+)
+
+
+@pytest.mark.parametrize("return_type", POINTER_RETURN_TYPES)
 def test_func_length_pointer_return_ok(check, return_type):
     """Functions with pointer return types under limit should pass."""
-    body = "\n".join(["    x++;"] * 37)
-    code = f"{return_type} f(void)\n{{\n    int x = 0;\n{body}\n    return 0;\n}}\n"
+    code = f"{return_type} f(void)\n{{\n    int x = 0;\n{BODY_37}\n    return 0;\n}}\n"
     assert not check(code, "fun.length")
 
 
-@pytest.mark.parametrize("return_type", [
-    "char *",
-    "int *",
-    "void *",
-    "char **",
-    "int ***",
-    "struct foo *",
-    "const char *",
-    "static char *",
-], ids=["char*", "int*", "void*", "char**", "int***",
-        "struct-foo*", "const-char*", "static-char*"])
+@pytest.mark.parametrize("return_type", POINTER_RETURN_TYPES)
 def test_func_length_pointer_return_fail(check, return_type):
     """Functions with pointer return types over limit should fail."""
-    body = "\n".join(["    x++;"] * 39)
-    code = f"{return_type} f(void) {{\n    int x = 0;\n{body}\n    return 0;\n}}\n"
+    code = f"{return_type} f(void) {{\n    int x = 0;\n{BODY_39}\n    return 0;\n}}\n"
     assert check(code, "fun.length")
 
 
-@pytest.mark.parametrize("return_type", [
-    "char *",
-    "int **",
-    "void *",
-], ids=["char*", "int**", "void*"])
+ARG_COUNT_POINTER_RETURN_CASES = (
+    pytest.param("char *", id="char*"),
+    pytest.param("int **", id="int**"),
+    pytest.param("void *", id="void*"),
+)
+
+
+@pytest.mark.parametrize("return_type", ARG_COUNT_POINTER_RETURN_CASES)
 def test_arg_count_pointer_return(check, return_type):
     """Arg count check works for functions with pointer return types."""
     # 4 args should pass
@@ -120,25 +117,30 @@ def test_arg_count_pointer_return(check, return_type):
 
 
 # Test complex return types (function pointers, array pointers)
-@pytest.mark.parametrize("signature,expect_fail", [
+FUNC_LENGTH_COMPLEX_RETURN_TYPES_CASES = (
     # Function returning pointer to array - over limit
-    ("int (*f(void))[10]", True),
+    pytest.param("int (*f(void))[10]", True, id="ptr-to-array"),
     # Function returning function pointer - over limit
-    ("int (*f(void))(int)", True),
+    pytest.param("int (*f(void))(int)", True, id="func-ptr"),
     # Parenthesized declarator - over limit
-    ("int (f)(void)", True),
-], ids=["ptr-to-array", "func-ptr", "paren-declarator"])
+    pytest.param("int (f)(void)", True, id="paren-declarator"),
+)
+
+
+@pytest.mark.parametrize("signature,expect_fail", FUNC_LENGTH_COMPLEX_RETURN_TYPES_CASES)
 def test_func_length_complex_return_types(check, signature, expect_fail):
     """Function length detection works for complex return types."""
-    body = "\n".join(["    x++;"] * 39)
-    code = f"{signature} {{\n    int x = 0;\n{body}\n    return 0;\n}}\n"
+    code = f"{signature} {{\n    int x = 0;\n{BODY_39}\n    return 0;\n}}\n"
     assert check(code, "fun.length") == expect_fail
 
 
-@pytest.mark.parametrize("signature", [
-    "int (*f(void))[10]",   # Returns pointer to array
-    "int (*f(void))(int)",  # Returns function pointer
-], ids=["ptr-to-array", "func-ptr"])
+ARG_COUNT_COMPLEX_RETURN_TYPES_CASES = (
+    pytest.param("int (*f(void))[10]", id="ptr-to-array"),  # Returns pointer to array
+    pytest.param("int (*f(void))(int)", id="func-ptr"),  # Returns function pointer
+)
+
+
+@pytest.mark.parametrize("signature", ARG_COUNT_COMPLEX_RETURN_TYPES_CASES)
 def test_arg_count_complex_return_types(check, signature):
     """Arg count detection works for complex return types."""
     # Replace (void) with 5 args to trigger violation
@@ -147,9 +149,12 @@ def test_arg_count_complex_return_types(check, signature):
     assert check(code, "fun.arg.count")
 
 
-@pytest.mark.parametrize("code,should_fail", [
-    (PROTO_VOID_OK, False),
-    (PROTO_EMPTY, True),
-], ids=["void-ok", "empty-parens-fail"])
+PROTO_VOID_CASES = (
+    pytest.param(PROTO_VOID_OK, False, id="void-ok"),
+    pytest.param(PROTO_EMPTY, True, id="empty-parens-fail"),
+)
+
+
+@pytest.mark.parametrize("code,should_fail", PROTO_VOID_CASES)
 def test_proto_void(check, code, should_fail):
     assert check(code, "fun.proto.void", suffix=".h") == should_fail
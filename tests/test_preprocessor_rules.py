@@ -1,89 +1,97 @@
 """Tests for preprocessor rules."""
 
 import pytest
-from textwrap import dedent
-
-GUARD_OK = dedent("""\
-    #ifndef TEST_H
-    #define TEST_H
-    int x;
-    #endif /* TEST_H */
-""")
-
-ENDIF_OK = dedent("""\
-    #ifndef TEST_H
-    #define TEST_H
-    #endif /* TEST_H */
-""")
-
-ENDIF_NO_COMMENT = dedent("""\
-    #ifndef TEST_H
-    #define TEST_H
-    #endif
-""")
-
-ELSE_WITH_COMMENT = dedent("""\
-    #ifndef TEST_H
-    #define TEST_H
-    #ifdef FOO
-    int x;
-    #else /* !FOO */
-    int y;
-    #endif /* FOO */
-    #endif /* TEST_H */
-""")
-
-ELSE_NO_COMMENT = dedent("""\
-    #ifndef TEST_H
-    #define TEST_H
-    #ifdef FOO
-    int x;
-    #else
-    int y;
-    #endif /* FOO */
-    #endif /* TEST_H */
-""")
-
-
-@pytest.mark.parametrize("code,should_fail", [
-    (GUARD_OK, False),
-    ("int x;\n", True),
-], ids=["guard-ok", "no-guard"])
+
+GUARD_OK = """\
+#ifndef TEST_H
+#define TEST_H
+int x;
+#endif /* TEST_H */
+"""
+
+ENDIF_OK = """\
+#ifndef TEST_H
+#define TEST_H
+#endif /* TEST_H */
+"""
+
+ENDIF_NO_COMMENT = """\
+#ifndef TEST_H
+#define TEST_H
+#endif
+"""
+
+ELSE_WITH_COMMENT = """\
+#ifndef TEST_H
+#define TEST_H
+#ifdef FOO
+int x;
+#else /* !FOO */
+int y;
+#endif /* FOO */
+#endif /* TEST_H */
+"""
+
+ELSE_NO_COMMENT = """\
+#ifndef TEST_H
+#define TEST_H
+#ifdef FOO
+int x;
+#else
+int y;
+#endif /* FOO */
+#endif /* TEST_H */
+"""
+
+
+CPP_GUARD_CASES = (
+    pytest.param(GUARD_OK, False, id="guard-ok"),
+    pytest.param("int x;\n", True, id="no-guard"),
+)
+
+
+@pytest.mark.parametrize("code,should_fail", CPP_GUARD_CASES)
 def test_cpp_guard(check, code, should_fail):
     assert check(code, "cpp.guard", suffix=".h") == should_fail
 
 
-@pytest.mark.parametrize("code,should_fail", [
-    (ENDIF_OK, False),
-    (ENDIF_NO_COMMENT, True),
-    (ELSE_WITH_COMMENT, False),
-    (ELSE_NO_COMMENT, True),
-], ids=["endif-comment-ok", "endif-no-comment", "else-comment-ok", "else-no-comment"])
+CPP_ENDIF_COMMENT_CASES = (
+    pytest.param(ENDIF_OK, False, id="endif-comment-ok"),
+    pytest.param(ENDIF_NO_COMMENT, True, id="endif-no-comment"),
+    pytest.param(ELSE_WITH_COMMENT, False, id="else-comment-ok"),
+    pytest.param(ELSE_NO_COMMENT, True, id="else-no-comment"),
+)
+
+
+@pytest.mark.parametrize("code,should_fail", CPP_ENDIF_COMMENT_CASES)
 def test_cpp_endif_comment(check, code, should_fail):
     assert check(code, "cpp.if", suffix=".h") == should_fail
 
 
-@pytest.mark.parametrize("code,should_fail", [
-    ("#define X 1\n", False),
-    ("  #define X 1\n", True),
-    ("\t#define X 1\n", True),
-], ids=["col0-ok", "indented-spaces", "indented-tab"])
+CPP_MARK_CASES = (
+    pytest.param("#define X 1\n", False, id="col0-ok"),
+    pytest.param("  #define X 1\n", True, id="indented-spaces"),
+    pytest.param("\t#define X 1\n", True, id="indented-tab"),
+)
+
+
+@pytest.mark.parametrize("code,should_fail", CPP_MARK_CASES)
 def test_cpp_mark(check, code, should_fail):
     assert check(code, "cpp.mark") == should_fail
 
 
-@pytest.mark.parametrize("code,should_fail", [
-    ("int arr[10];\n", False),
-    ("int arr<:10:>;\n", True),
-    ("// outb(COM1 + 0, ???);\n", False),
-    ("/* trigraph ??? in block comment */\n", False),
-    ("int x; // comment with <:\n", False),
-    ("int x; /* ??? */ int y;\n", False),
-    ("/* start\n??? still comment\n*/ int ok;\n", False),
-    ("int x <:0:>; // comment\n", True),
-], ids=["brackets-ok", "digraph-fail", "trigraph-in-line-comment",
-        "trigraph-in-block-comment", "digraph-in-line-comment",
-        "trigraph-in-inline-block-comment", "trigraph-in-multiline-block-comment",
-        "digraph-in-code-with-comment"])
+CPP_DIGRAPHS_CASES = (
+    pytest.param("int arr[10];\n", False, id="brackets-ok"),
+    pytest.param("int arr<:10:>;\n", True, id="digraph-fail"),
+    pytest.param("// outb(COM1 + 0, ???);\n", False, id="trigraph-in-line-comment"),
+    pytest.param("/* trigraph ??? in block comment */\n", False, id="trigraph-in-block-comment"),
+    pytest.param("int x; // comment with <:\n", False, id="digraph-in-line-comment"),
+    pytest.param("int x; /* ??? */ int y;\n", False, id="trigraph-in-inline-block-comment"),
+    pytest.param("/* start\n??? still comment\n*/ int ok;\n", False, id="trigraph-in-multiline-block-comment"),
+    pytest.param("int x <:0:>; // comment\n", True, id="digraph-in-code-with-comment"),
+)
+
+
+@pytest.mark.parametrize("code,should_fail", CPP_DIGRAPHS_CASES)
 def test_cpp_digraphs(check, code, should_fail):
     assert check(code, "cpp.digraphs") == should_fail